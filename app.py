@@ -10,85 +10,352 @@ This application provides AI-powered text processing features including:
 - Intelligent Email Automation
 """
 
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, Response, render_template, request, send_file
+import io
 import os
+import json
+import logging
+import shutil
 import tempfile
-from services.summarizer import TextSummarizer
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+    print("⚠️ Flask-Compress not available, responses will not be compressed")
+
+from utils import OrjsonProvider, ojsonify, limit_content_length
+from services.summarizer import TextSummarizer, LENGTH_CONFIGS, SUMMARY_STYLES, CHUNK_THRESHOLD_CHARS
+from services.batcher import DynamicBatcher
 from services.translator import LanguageTranslator
 from services.speech_to_text import SpeechToTextConverter
 from services.text_to_speech import TextToSpeechConverter
 from services.email_service import EmailService
 
+# Service logs go through the logging module; set LOG_LEVEL=WARNING in production
+logging.basicConfig(
+    level=os.environ.get('LOG_LEVEL', 'INFO').upper(),
+    format='%(asctime)s %(levelname)s [%(name)s] %(message)s'
+)
+
 # Initialize Flask application
 app = Flask(__name__)
+app.json = OrjsonProvider(app)  # request.get_json() parses with orjson
 app.config['SECRET_KEY'] = 'autocomm-secret-key-2024'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
+# Per-route request body limits (speech-to-text uploads keep the global 16MB)
+MAX_SUMMARIZE_BYTES = 1024 * 1024
+MAX_TRANSLATE_BYTES = 256 * 1024
+MAX_TTS_BYTES = 64 * 1024
+MAX_EMAIL_BYTES = 1024 * 1024
+
+# Shortest text worth summarizing
+MIN_SUMMARY_CHARS = 100
+
+# Uploaded audio is staged in RAM-backed tmpfs when available, copied in 1MB blocks
+UPLOAD_TEMP_DIR = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
+UPLOAD_COPY_BUFFER = 1024 * 1024
+
+# Compress text responses (summaries, translations, pages); audio is already compressed
+app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html', 'text/plain', 'text/css', 'application/javascript']
+app.config['COMPRESS_LEVEL'] = 5
+app.config['COMPRESS_MIN_SIZE'] = 500
+
+if COMPRESS_AVAILABLE:
+    Compress(app)
+
+# Let a front-end server (e.g. Apache mod_xsendfile) stream generated files from disk
+app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE', 'False').lower() in ('1', 'true')
+
+# Static assets are cache-busted by a version query string, so they can be cached for a year
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 365 * 24 * 60 * 60
+
+# Generated and uploaded files under static/ that aren't versioned assets
+UNVERSIONED_STATIC_DIRS = {'temp', 'uploads'}
+
+def _static_version(static_folder):
+    """
+    Version tag for static assets, derived from their latest modification time
+    """
+    latest = 0
+    for root, dirs, files in os.walk(static_folder):
+        if root == static_folder:
+            # Skip the TTS cache and uploads: they grow without bound and
+            # change on every request, which would bust every asset URL
+            dirs[:] = [name for name in dirs if name not in UNVERSIONED_STATIC_DIRS]
+        for name in files:
+            latest = max(latest, os.stat(os.path.join(root, name)).st_mtime_ns)
+    return format(latest, 'x')
+
+STATIC_VERSION = _static_version(app.static_folder)
+
+@app.url_defaults
+def add_static_version(endpoint, values):
+    """
+    Append the static version to every url_for('static', ...) link
+    """
+    if endpoint == 'static':
+        values.setdefault('v', STATIC_VERSION)
+
+# The pages take no per-request data, so each one is rendered once and served as bytes
+_PAGE_CACHE = {}
+
+def render_page(template_name):
+    """
+    Serve a static page from the rendered-page cache (re-rendered every time in debug mode)
+    """
+    body = None if app.debug else _PAGE_CACHE.get(template_name)
+    
+    if body is None:
+        body = render_template(template_name).encode('utf-8')
+        _PAGE_CACHE[template_name] = body
+    
+    return Response(body, mimetype='text/html')
+
 # Initialize AI services
 summarizer = TextSummarizer()
 translator = LanguageTranslator()
 speech_to_text = SpeechToTextConverter()
-text_to_speech = TextToSpeechConverter()
+text_to_speech = TextToSpeechConverter(cache_dir=os.path.join(app.static_folder, 'temp'))
 email_service = EmailService()
 
+# Coalesce concurrent summarization requests into batched model calls
+summary_batcher = DynamicBatcher(summarizer.summarize_batch, max_batch_size=16, max_wait_ms=10)
+
+# Repeated short phrases (e.g. UI strings) are translated once and served from memory
+TRANSLATION_CACHE_MAX_CHARS = 512
+TRANSLATION_CACHE_SIZE = 4096
+_translation_cache = OrderedDict()  # (text, source_lang, target_lang) -> translation
+_translation_cache_lock = threading.Lock()
+
+def _translate_cached(text, source_lang, target_lang):
+    """
+    Memoized translation for short texts
+    
+    Only model output is cached: fallback and error results (e.g. while a
+    model is temporarily unavailable) are recomputed on every request.
+    """
+    key = (text, source_lang, target_lang)
+    with _translation_cache_lock:
+        translation = _translation_cache.get(key)
+        if translation is not None:
+            _translation_cache.move_to_end(key)
+            return translation
+    
+    translation = translator.translate_with_model(text, source_lang, target_lang)
+    if translation is None:
+        # The model already had its try; don't run it again via translate()
+        return translator.translate_without_model(text, source_lang, target_lang)
+    
+    with _translation_cache_lock:
+        _translation_cache[key] = translation
+        _translation_cache.move_to_end(key)
+        if len(_translation_cache) > TRANSLATION_CACHE_SIZE:
+            _translation_cache.popitem(last=False)
+    
+    return translation
+
+# The converter caches generated speech on disk by content hash; least recently used files are pruned
+TTS_CACHE_DIR = text_to_speech.cache_dir
+TTS_CACHE_MAX_BYTES = 256 * 1024 * 1024
+TTS_CACHE_PRUNE_INTERVAL = 60  # seconds
+_tts_cache_lock = threading.Lock()
+_tts_cache_last_prune = 0.0
+
+def _prune_tts_cache():
+    """
+    Delete the least recently used cached audio files once the cache exceeds its size cap
+    """
+    global _tts_cache_last_prune
+    
+    with _tts_cache_lock:
+        now = time.monotonic()
+        if now - _tts_cache_last_prune < TTS_CACHE_PRUNE_INTERVAL:
+            return
+        _tts_cache_last_prune = now
+        
+        entries = []
+        total = 0
+        try:
+            with os.scandir(TTS_CACHE_DIR) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith('.mp3'):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+                        total += stat.st_size
+        except OSError as e:
+            # Missing or unreadable cache directory: nothing to prune
+            app.logger.warning("Could not prune TTS cache: %s", e)
+            return
+        
+        # Cache hits refresh mtime, so the oldest mtime is the least recently used
+        entries.sort()
+        for _, size, path in entries:
+            if total <= TTS_CACHE_MAX_BYTES:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+            except FileNotFoundError:
+                pass
+
+# Seconds a summarization request waits for its batch to finish
+SUMMARY_TIMEOUT = 60
+
+# Emails are sent in the background; clients poll /api/send-email/<job_id> for the result.
+# Job state lives in one small file per job, so a poll can land on any worker process
+_MAIL_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='mail')
+MAIL_JOB_DIR = os.environ.get('MAIL_JOB_DIR', os.path.join(tempfile.gettempdir(), 'autoComm-mail-jobs'))
+
+# Seconds an email job is kept around for polling
+MAIL_JOB_TTL = 15 * 60
+
+def _mail_job_path(job_id):
+    """
+    State file of an email job, or None if job_id isn't one of ours (e.g. '../x')
+    """
+    if len(job_id) != 32 or any(c not in '0123456789abcdef' for c in job_id):
+        return None
+    return os.path.join(MAIL_JOB_DIR, job_id + '.json')
+
+def _write_mail_job(job_id, state):
+    """
+    Atomically replace the state of an email job
+    """
+    path = _mail_job_path(job_id)
+    os.makedirs(MAIL_JOB_DIR, exist_ok=True)
+    with open(path + '.tmp', 'w') as f:
+        json.dump(state, f)
+    os.replace(path + '.tmp', path)
+
+def _read_mail_job(job_id):
+    """
+    State of an email job, or None if it is unknown or has expired
+    """
+    path = _mail_job_path(job_id)
+    if path is None:
+        return None
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _expire_mail_jobs():
+    """
+    Delete job files older than MAIL_JOB_TTL, polled or not
+    """
+    cutoff = time.time() - MAIL_JOB_TTL
+    try:
+        with os.scandir(MAIL_JOB_DIR) as it:
+            for entry in it:
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except FileNotFoundError:
+                    pass
+    except OSError as e:
+        app.logger.warning("Could not expire email jobs: %s", e)
+
+def _run_mail_job(job_id, *args):
+    """
+    Send an email on the background sender and record the outcome for polling
+    """
+    try:
+        state = {'status': 'sent' if email_service.send_email(*args) else 'failed'}
+    except Exception as e:
+        state = {'status': 'error', 'error': str(e)}
+    
+    _write_mail_job(job_id, state)
+    _expire_mail_jobs()
+
 @app.route('/')
 def index():
     """
     Home page route - displays the main dashboard
     """
-    return render_template('index.html')
+    return render_page('index.html')
 
 @app.route('/summarizer')
 def summarizer_page():
     """
     Text Summarization page
     """
-    return render_template('summarizer.html')
+    return render_page('summarizer.html')
 
 @app.route('/translator')
 def translator_page():
     """
     Language Translation page
     """
-    return render_template('translator.html')
+    return render_page('translator.html')
 
 @app.route('/speech')
 def speech_page():
     """
     Speech processing page (Speech-to-Text and Text-to-Speech)
     """
-    return render_template('speech.html')
+    return render_page('speech.html')
 
 @app.route('/email')
 def email_page():
     """
     Email automation page
     """
-    return render_template('email.html')
+    return render_page('email.html')
 
 # API Routes for AI Services
 
 @app.route('/api/summarize', methods=['POST'])
+@limit_content_length(MAX_SUMMARIZE_BYTES)
 def api_summarize():
     """
     API endpoint for text summarization
     """
     try:
-        data = request.get_json()
+        # A body this small cannot hold a long enough text, so skip parsing it
+        # (chunked requests have no Content-Length and are checked after parsing)
+        if request.content_length is not None and request.content_length < MIN_SUMMARY_CHARS:
+            return ojsonify({'error': 'Text must be at least 100 characters long for meaningful summarization'}, 400)
+        
+        data = request.get_json(silent=True, cache=False) or {}
         text = data.get('text', '').strip()
         summary_length = data.get('summary_length', 'medium')
         summary_style = data.get('summary_style', 'paragraph')
         
         if not text:
-            return jsonify({'error': 'Text is required'}), 400
+            return ojsonify({'error': 'Text is required'}, 400)
         
-        if len(text) < 100:
-            return jsonify({'error': 'Text must be at least 100 characters long for meaningful summarization'}), 400
+        if len(text) < MIN_SUMMARY_CHARS:
+            return ojsonify({'error': 'Text must be at least 100 characters long for meaningful summarization'}, 400)
         
-        # Generate summary using AI service with length and style options
-        summary = summarizer.summarize(text, length=summary_length, style=summary_style)
+        if not isinstance(summary_length, str) or summary_length not in LENGTH_CONFIGS:
+            return ojsonify({'error': f"summary_length must be one of: {', '.join(LENGTH_CONFIGS)}"}, 400)
         
-        return jsonify({
+        if not isinstance(summary_style, str) or summary_style not in SUMMARY_STYLES:
+            return ojsonify({'error': f"summary_style must be one of: {', '.join(SUMMARY_STYLES)}"}, 400)
+        
+        if len(text) > CHUNK_THRESHOLD_CHARS:
+            # Long texts are chunked and summarized on their own, so they
+            # don't hold up the shared batch worker
+            summary = summarizer.summarize(text, length=summary_length, style=summary_style)
+        else:
+            # Generate summary using AI service with length and style options,
+            # batched together with any other in-flight requests
+            future = summary_batcher.submit(text, summary_length, summary_style)
+            try:
+                summary = future.result(timeout=SUMMARY_TIMEOUT)
+            except FutureTimeoutError:
+                future.cancel()
+                return ojsonify({'error': f'Summarization timed out after {SUMMARY_TIMEOUT} seconds'}, 503)
+        
+        return ojsonify({
             'success': True,
             'summary': summary,
             'original_length': len(text),
@@ -96,26 +363,36 @@ def api_summarize():
         })
         
     except Exception as e:
-        return jsonify({'error': f'Summarization failed: {str(e)}'}), 500
+        return ojsonify({'error': f'Summarization failed: {str(e)}'}, 500)
 
 @app.route('/api/translate', methods=['POST'])
+@limit_content_length(MAX_TRANSLATE_BYTES)
 def api_translate():
     """
     API endpoint for language translation
     """
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True, cache=False) or {}
         text = data.get('text', '').strip()
         source_lang = data.get('source_language', 'auto')
         target_lang = data.get('target_language', 'en')
         
         if not text:
-            return jsonify({'error': 'Text is required'}), 400
+            return ojsonify({'error': 'Text is required'}, 400)
+        
+        if not isinstance(source_lang, str) or not isinstance(target_lang, str):
+            return ojsonify({'error': 'source_language and target_language must be language codes'}, 400)
         
-        # Translate text using AI service
-        translation = translator.translate(text, source_lang, target_lang)
+        # Nothing to translate when both languages are the same
+        if source_lang != 'auto' and source_lang == target_lang:
+            translation = text
+        elif len(text) < TRANSLATION_CACHE_MAX_CHARS:
+            translation = _translate_cached(text, source_lang, target_lang)
+        else:
+            # Translate text using AI service (long texts bypass the cache to bound memory)
+            translation = translator.translate(text, source_lang, target_lang)
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'translation': translation,
             'source_language': source_lang,
@@ -123,7 +400,7 @@ def api_translate():
         })
         
     except Exception as e:
-        return jsonify({'error': f'Translation failed: {str(e)}'}), 500
+        return ojsonify({'error': f'Translation failed: {str(e)}'}, 500)
 
 @app.route('/api/speech-to-text', methods=['POST'])
 def api_speech_to_text():
@@ -132,65 +409,125 @@ def api_speech_to_text():
     """
     try:
         if 'audio' not in request.files:
-            return jsonify({'error': 'Audio file is required'}), 400
+            return ojsonify({'error': 'Audio file is required'}, 400)
         
         audio_file = request.files['audio']
         
         if audio_file.filename == '':
-            return jsonify({'error': 'No audio file selected'}), 400
+            return ojsonify({'error': 'No audio file selected'}, 400)
         
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as temp_file:
-            audio_file.save(temp_file.name)
+        # Stream the upload straight into a temporary file
+        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.wav', dir=UPLOAD_TEMP_DIR)
+        try:
+            with temp_file:
+                shutil.copyfileobj(audio_file.stream, temp_file, UPLOAD_COPY_BUFFER)
             
             # Convert speech to text
             text = speech_to_text.convert_audio_to_text(temp_file.name)
-            
-            # Clean up temporary file
+        finally:
+            # Clean up temporary file, even if conversion failed
             os.unlink(temp_file.name)
-            
-            return jsonify({
-                'success': True,
-                'text': text
-            })
-            
+        
+        return ojsonify({
+            'success': True,
+            'text': text
+        })
+        
     except Exception as e:
-        return jsonify({'error': f'Speech-to-text conversion failed: {str(e)}'}), 500
+        return ojsonify({'error': f'Speech-to-text conversion failed: {str(e)}'}, 500)
 
 @app.route('/api/text-to-speech', methods=['POST'])
+@limit_content_length(MAX_TTS_BYTES)
 def api_text_to_speech():
     """
     API endpoint for text-to-speech conversion
     """
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True, cache=False) or {}
         text = data.get('text', '').strip()
         language = data.get('language', 'en')
         
         if not text:
-            return jsonify({'error': 'Text is required'}), 400
+            return ojsonify({'error': 'Text is required'}, 400)
         
-        # Convert text to speech
+        # Convert text to speech (previously generated audio comes from the converter's cache)
         audio_file_path = text_to_speech.convert_text_to_speech(text, language)
         
+        # Anything outside the cache (uncacheable audio, fallback text) is a
+        # temporary file that this request owns
+        cached = bool(audio_file_path) and os.path.dirname(audio_file_path) == TTS_CACHE_DIR
+        
+        if cached:
+            _prune_tts_cache()
+            audio = audio_file_path
+        else:
+            # Serve temporary files from memory so they can be deleted right away
+            try:
+                with open(audio_file_path, 'rb') as f:
+                    audio = io.BytesIO(f.read())
+            finally:
+                text_to_speech.cleanup_temp_files(audio_file_path)
+        
         # Return the audio file
-        return send_file(
-            audio_file_path,
+        response = send_file(
+            audio,
             as_attachment=True,
             download_name='speech.mp3',
             mimetype='audio/mpeg'
         )
         
+        audio_id = os.path.basename(audio_file_path)[:-len('.mp3')]
+        if cached and _is_audio_id(audio_id):
+            # Cached audio can be fetched again (conditionally) with a plain GET
+            response.headers['Content-Location'] = f'/api/text-to-speech/{audio_id}'
+        
+        return response
+        
     except Exception as e:
-        return jsonify({'error': f'Text-to-speech conversion failed: {str(e)}'}), 500
+        return ojsonify({'error': f'Text-to-speech conversion failed: {str(e)}'}, 500)
+
+def _is_audio_id(audio_id):
+    """
+    Whether audio_id looks like a TTS cache key (a sha256 hex digest)
+    """
+    return len(audio_id) == 64 and all(c in '0123456789abcdef' for c in audio_id)
+
+@app.route('/api/text-to-speech/<audio_id>', methods=['GET'])
+def api_text_to_speech_audio(audio_id):
+    """
+    API endpoint for re-downloading previously generated speech
+    
+    The id is a hash of the text and settings, so the audio behind it never
+    changes: it is served with that hash as its ETag and cached for a year.
+    """
+    if not _is_audio_id(audio_id):
+        return ojsonify({'error': 'Unknown audio'}, 404)
+    
+    try:
+        response = send_file(
+            os.path.join(TTS_CACHE_DIR, audio_id + '.mp3'),
+            download_name='speech.mp3',
+            mimetype='audio/mpeg',
+            conditional=True,
+            etag=audio_id,
+            last_modified=None,
+            max_age=365 * 24 * 60 * 60
+        )
+    except FileNotFoundError:
+        # Pruned from the cache; POST the text again to regenerate it
+        return ojsonify({'error': 'Unknown audio'}, 404)
+    
+    response.headers['Cache-Control'] += ', immutable'
+    return response
 
 @app.route('/api/send-email', methods=['POST'])
+@limit_content_length(MAX_EMAIL_BYTES)
 def api_send_email():
     """
     API endpoint for automated email sending
     """
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True, cache=False) or {}
         sender_email = data.get('sender_email', '').strip()
         sender_password = data.get('sender_password', '').strip()
         receiver_email = data.get('receiver_email', '').strip()
@@ -199,10 +536,15 @@ def api_send_email():
         
         # Validate required fields
         if not all([sender_email, sender_password, receiver_email, subject, message]):
-            return jsonify({'error': 'All fields are required'}), 400
+            return ojsonify({'error': 'All fields are required'}, 400)
         
-        # Send email using email service
-        success = email_service.send_email(
+        # Queue the email on the background sender and return immediately
+        job_id = uuid.uuid4().hex
+        _write_mail_job(job_id, {'status': 'pending'})
+        
+        _MAIL_EXECUTOR.submit(
+            _run_mail_job,
+            job_id,
             sender_email, 
             sender_password, 
             receiver_email, 
@@ -210,43 +552,80 @@ def api_send_email():
             message
         )
         
-        if success:
-            return jsonify({
-                'success': True,
-                'message': 'Email sent successfully!'
-            })
-        else:
-            return jsonify({'error': 'Failed to send email. Please check your credentials and try again.'}), 500
+        return ojsonify({
+            'success': True,
+            'status': 'queued',
+            'job_id': job_id
+        }, 202)
             
     except Exception as e:
-        return jsonify({'error': f'Email sending failed: {str(e)}'}), 500
+        return ojsonify({'error': f'Email sending failed: {str(e)}'}, 500)
+
+@app.route('/api/send-email/<job_id>', methods=['GET'])
+def api_send_email_status(job_id):
+    """
+    API endpoint for polling the result of a queued email
+    """
+    job = _read_mail_job(job_id)
+    
+    if job is None:
+        return ojsonify({'status': 'unknown', 'error': 'Unknown email job'}, 404)
+    
+    if job['status'] == 'pending':
+        return ojsonify({
+            'success': True,
+            'status': 'pending',
+            'job_id': job_id
+        }, 202)
+    
+    # The result has been delivered, so the job can be dropped
+    try:
+        os.unlink(_mail_job_path(job_id))
+    except FileNotFoundError:
+        pass
+    
+    if job['status'] == 'error':
+        return ojsonify({'error': f"Email sending failed: {job.get('error', '')}"}, 500)
+    
+    if job['status'] == 'sent':
+        return ojsonify({
+            'success': True,
+            'status': 'sent',
+            'message': 'Email sent successfully!'
+        })
+    else:
+        return ojsonify({'error': 'Failed to send email. Please check your credentials and try again.'}, 500)
 
 @app.errorhandler(404)
 def not_found(error):
     """
     Handle 404 errors
     """
-    return render_template('index.html'), 404
+    return render_page('index.html'), 404
 
 @app.errorhandler(500)
 def internal_error(error):
     """
     Handle 500 errors
     """
-    return jsonify({'error': 'Internal server error'}), 500
+    return ojsonify({'error': 'Internal server error'}, 500)
 
 if __name__ == '__main__':
-    # Create necessary directories if they don't exist
-    os.makedirs('static/uploads', exist_ok=True)
-    os.makedirs('static/temp', exist_ok=True)
+    debug = os.environ.get('FLASK_DEBUG', 'True').lower() in ('1', 'true')
     
-    print("🚀 AutoComm - AI-Powered Communication Suite Starting...")
-    print("📍 Access the application at: http://localhost:5000")
-    print("🤖 AI Services: Summarization, Translation, Speech Processing, Email Automation")
+    # With the reloader on, only the child process that actually serves requests does startup work
+    if not debug or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        # Create necessary directories if they don't exist
+        os.makedirs('static/uploads', exist_ok=True)
+        os.makedirs('static/temp', exist_ok=True)
+        
+        print("🚀 AutoComm - AI-Powered Communication Suite Starting...")
+        print("📍 Access the application at: http://localhost:5000")
+        print("🤖 AI Services: Summarization, Translation, Speech Processing, Email Automation")
     
-    # Run the Flask application
+    # Run the Flask development server (use wsgi.py with Gunicorn in production)
     app.run(
-        debug=True,
+        debug=debug,
         host='0.0.0.0',
         port=5000,
         threaded=True
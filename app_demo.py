@@ -5,21 +5,64 @@ Main Flask Application - Demo Version with Fallback AI Services
 This version works without requiring PyTorch or heavy AI dependencies
 """
 
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, render_template, request, send_file
 import os
+import logging
+import re
 import tempfile
 
+from utils import OrjsonProvider, ojsonify
+
 # Import simple fallback services
 from services.email_service import EmailService
 
+# Service logs go through the logging module; set LOG_LEVEL=WARNING in production
+logging.basicConfig(
+    level=os.environ.get('LOG_LEVEL', 'INFO').upper(),
+    format='%(asctime)s %(levelname)s [%(name)s] %(message)s'
+)
+
 # Initialize Flask application
 app = Flask(__name__)
+app.json = OrjsonProvider(app)  # request.get_json() parses with orjson
 app.config['SECRET_KEY'] = 'autocomm-secret-key-2024'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
 # Initialize services
 email_service = EmailService()
 
+# Simple word replacements for demo translation
+DEMO_TRANSLATIONS = {
+    'hello': {'es': 'hola', 'fr': 'bonjour', 'de': 'hallo', 'it': 'ciao'},
+    'world': {'es': 'mundo', 'fr': 'monde', 'de': 'welt', 'it': 'mondo'},
+    'good': {'es': 'bueno', 'fr': 'bon', 'de': 'gut', 'it': 'buono'},
+    'morning': {'es': 'mañana', 'fr': 'matin', 'de': 'morgen', 'it': 'mattina'},
+    'thank you': {'es': 'gracias', 'fr': 'merci', 'de': 'danke', 'it': 'grazie'}
+}
+
+def _build_demo_patterns(translations):
+    """
+    Invert the demo word table into one (pattern, mapping) pair per target language
+    """
+    by_lang = {}
+    for word, targets in translations.items():
+        for lang, translated in targets.items():
+            by_lang.setdefault(lang, {})[word] = translated
+    
+    patterns = {}
+    for lang, mapping in by_lang.items():
+        # Longest phrases first so 'thank you' wins over any shorter prefix
+        words = sorted(mapping, key=len, reverse=True)
+        pattern = re.compile(r'\b(' + '|'.join(map(re.escape, words)) + r')\b', re.IGNORECASE)
+        patterns[lang] = (pattern, mapping)
+    
+    return patterns
+
+_DEMO_BY_LANG = _build_demo_patterns(DEMO_TRANSLATIONS)
+
+# A sentence runs up to its terminating punctuation (or the end of the text)
+_SENT_RE = re.compile(r'[^.!?]+(?:[.!?]+|$)')
+
 @app.route('/')
 def index():
     """
@@ -67,15 +110,15 @@ def api_summarize():
         text = data.get('text', '').strip()
         
         if not text:
-            return jsonify({'error': 'Text is required'}), 400
+            return ojsonify({'error': 'Text is required'}, 400)
         
         if len(text) < 100:
-            return jsonify({'error': 'Text must be at least 100 characters long for meaningful summarization'}), 400
+            return ojsonify({'error': 'Text must be at least 100 characters long for meaningful summarization'}, 400)
         
         # Demo summarization using simple extraction
         summary = create_demo_summary(text)
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'summary': summary,
             'original_length': len(text),
@@ -83,7 +126,7 @@ def api_summarize():
         })
         
     except Exception as e:
-        return jsonify({'error': f'Summarization failed: {str(e)}'}), 500
+        return ojsonify({'error': f'Summarization failed: {str(e)}'}, 500)
 
 @app.route('/api/translate', methods=['POST'])
 def api_translate():
@@ -97,12 +140,12 @@ def api_translate():
         target_lang = data.get('target_language', 'en')
         
         if not text:
-            return jsonify({'error': 'Text is required'}), 400
+            return ojsonify({'error': 'Text is required'}, 400)
         
         # Demo translation
         translation = create_demo_translation(text, source_lang, target_lang)
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'translation': translation,
             'source_language': source_lang,
@@ -110,7 +153,7 @@ def api_translate():
         })
         
     except Exception as e:
-        return jsonify({'error': f'Translation failed: {str(e)}'}), 500
+        return ojsonify({'error': f'Translation failed: {str(e)}'}, 500)
 
 @app.route('/api/speech-to-text', methods=['POST'])
 def api_speech_to_text():
@@ -119,23 +162,23 @@ def api_speech_to_text():
     """
     try:
         if 'audio' not in request.files:
-            return jsonify({'error': 'Audio file is required'}), 400
+            return ojsonify({'error': 'Audio file is required'}, 400)
         
         audio_file = request.files['audio']
         
         if audio_file.filename == '':
-            return jsonify({'error': 'No audio file selected'}), 400
+            return ojsonify({'error': 'No audio file selected'}, 400)
         
         # Demo speech-to-text
         text = f"Demo transcription: This is a sample transcription of the uploaded audio file '{audio_file.filename}'. In a full version, this would contain the actual speech-to-text conversion using Google Speech API or similar services."
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'text': text
         })
         
     except Exception as e:
-        return jsonify({'error': f'Speech-to-text conversion failed: {str(e)}'}), 500
+        return ojsonify({'error': f'Speech-to-text conversion failed: {str(e)}'}, 500)
 
 @app.route('/api/text-to-speech', methods=['POST'])
 def api_text_to_speech():
@@ -148,7 +191,7 @@ def api_text_to_speech():
         language = data.get('language', 'en')
         
         if not text:
-            return jsonify({'error': 'Text is required'}), 400
+            return ojsonify({'error': 'Text is required'}, 400)
         
         # Create a demo text file instead of audio (since gTTS requires internet)
         temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.txt', mode='w')
@@ -163,7 +206,7 @@ def api_text_to_speech():
         )
         
     except Exception as e:
-        return jsonify({'error': f'Text-to-speech conversion failed: {str(e)}'}), 500
+        return ojsonify({'error': f'Text-to-speech conversion failed: {str(e)}'}, 500)
 
 @app.route('/api/send-email', methods=['POST'])
 def api_send_email():
@@ -180,7 +223,7 @@ def api_send_email():
         
         # Validate required fields
         if not all([sender_email, sender_password, receiver_email, subject, message]):
-            return jsonify({'error': 'All fields are required'}), 400
+            return ojsonify({'error': 'All fields are required'}, 400)
         
         # Send email using email service
         success = email_service.send_email(
@@ -192,41 +235,27 @@ def api_send_email():
         )
         
         if success:
-            return jsonify({
+            return ojsonify({
                 'success': True,
                 'message': 'Email sent successfully!'
             })
         else:
-            return jsonify({'error': 'Failed to send email. Please check your credentials and try again.'}), 500
+            return ojsonify({'error': 'Failed to send email. Please check your credentials and try again.'}, 500)
             
     except Exception as e:
-        return jsonify({'error': f'Email sending failed: {str(e)}'}), 500
+        return ojsonify({'error': f'Email sending failed: {str(e)}'}, 500)
 
 def create_demo_summary(text):
     """
     Create a demo summary using simple text extraction
     """
-    sentences = text.split('. ')
+    sentences = [sentence.strip() for sentence in _SENT_RE.findall(text) if sentence.strip()]
     if len(sentences) <= 3:
         return text
     
     # Take first sentence, a middle sentence, and last sentence
-    summary_sentences = []
-    
-    # First sentence
-    summary_sentences.append(sentences[0])
-    
-    # Middle sentence
-    middle_idx = len(sentences) // 2
-    if middle_idx < len(sentences) - 1:
-        summary_sentences.append(sentences[middle_idx])
-    
-    # Last sentence
-    if len(sentences) > 1:
-        summary_sentences.append(sentences[-1])
-    
-    summary = '. '.join(summary_sentences)
-    if not summary.endswith('.'):
+    summary = ' '.join([sentences[0], sentences[len(sentences) // 2], sentences[-1]])
+    if summary[-1] not in '.!?':
         summary += '.'
     
     return f"[DEMO SUMMARY] {summary}\n\nNote: This is a demonstration summary created using simple text extraction. The full version uses AI models like BART for intelligent summarization."
@@ -235,26 +264,12 @@ def create_demo_translation(text, source_lang, target_lang):
     """
     Create a demo translation
     """
-    # Simple word replacements for demo
-    demo_translations = {
-        'hello': {'es': 'hola', 'fr': 'bonjour', 'de': 'hallo', 'it': 'ciao'},
-        'world': {'es': 'mundo', 'fr': 'monde', 'de': 'welt', 'it': 'mondo'},
-        'good': {'es': 'bueno', 'fr': 'bon', 'de': 'gut', 'it': 'buono'},
-        'morning': {'es': 'mañana', 'fr': 'matin', 'de': 'morgen', 'it': 'mattina'},
-        'thank you': {'es': 'gracias', 'fr': 'merci', 'de': 'danke', 'it': 'grazie'}
-    }
-    
-    words = text.lower().split()
-    translated_words = []
-    
-    for word in words:
-        clean_word = word.strip('.,!?;:"')
-        if clean_word in demo_translations and target_lang in demo_translations[clean_word]:
-            translated_words.append(demo_translations[clean_word][target_lang])
-        else:
-            translated_words.append(word)
-    
-    translated_text = ' '.join(translated_words)
+    # Single regex pass over the text for the target language's word table
+    if target_lang in _DEMO_BY_LANG:
+        pattern, mapping = _DEMO_BY_LANG[target_lang]
+        translated_text = pattern.sub(lambda m: mapping[m.group(0).lower()], text)
+    else:
+        translated_text = text
     
     return f"[DEMO TRANSLATION] {translated_text}\n\nNote: This is a demonstration translation with basic word replacements. The full version uses AI models like Helsinki-NLP for accurate translation."
 
@@ -270,21 +285,25 @@ def internal_error(error):
     """
     Handle 500 errors
     """
-    return jsonify({'error': 'Internal server error'}), 500
+    return ojsonify({'error': 'Internal server error'}, 500)
 
 if __name__ == '__main__':
-    # Create necessary directories if they don't exist
-    os.makedirs('static/uploads', exist_ok=True)
-    os.makedirs('static/temp', exist_ok=True)
+    debug = os.environ.get('FLASK_DEBUG', 'True').lower() in ('1', 'true')
     
-    print("🚀 AutoComm - AI-Powered Communication Suite Starting...")
-    print("📍 Access the application at: http://localhost:5000")
-    print("🤖 Running in DEMO mode with fallback AI services")
-    print("💡 Install PyTorch and other AI dependencies for full functionality")
+    # With the reloader on, only the child process that actually serves requests does startup work
+    if not debug or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        # Create necessary directories if they don't exist
+        os.makedirs('static/uploads', exist_ok=True)
+        os.makedirs('static/temp', exist_ok=True)
+        
+        print("🚀 AutoComm - AI-Powered Communication Suite Starting...")
+        print("📍 Access the application at: http://localhost:5000")
+        print("🤖 Running in DEMO mode with fallback AI services")
+        print("💡 Install PyTorch and other AI dependencies for full functionality")
     
-    # Run the Flask application
+    # Run the Flask development server (use wsgi.py with Gunicorn in production)
     app.run(
-        debug=True,
+        debug=debug,
         host='0.0.0.0',
         port=5000,
         threaded=True
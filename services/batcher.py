@@ -0,0 +1,118 @@
+"""
+Dynamic Request Batching Service
+Coalesces concurrent requests into batches before calling a model
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+class DynamicBatcher:
+    def __init__(self, batch_fn, max_batch_size=16, max_wait_ms=10):
+        """
+        Initialize the batcher
+        
+        Args:
+            batch_fn (callable): Called as batch_fn(items, *args) and must return
+                one result per item, in order
+            max_batch_size (int): Maximum number of items dispatched together
+            max_wait_ms (int): How long to wait for more items after the first one
+        """
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        
+        self._queue = queue.Queue()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+
+    def submit(self, item, *args):
+        """
+        Queue an item for batched processing
+        
+        Items are only batched with others submitted with the same args.
+        
+        Args:
+            item: Input item (e.g. text to summarize)
+            *args: Extra options passed through to batch_fn
+        
+        Returns:
+            Future: Resolves to the result for this item
+        """
+        self._ensure_worker()
+        
+        future = Future()
+        self._queue.put((item, args, future))
+        return future
+
+    def _ensure_worker(self):
+        """
+        Start the background worker on first use (after any server fork), or
+        restart it if it has died
+        """
+        if self._worker is not None and self._worker.is_alive():
+            return
+        
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name='DynamicBatcher', daemon=True)
+                self._worker.start()
+
+    def _run(self):
+        """
+        Worker loop: block for the first item, then gather more until the
+        batch is full or the wait window closes
+        """
+        while True:
+            batch = [self._queue.get()]
+            
+            try:
+                deadline = time.monotonic() + self.max_wait
+                
+                while len(batch) < self.max_batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(self._queue.get(timeout=remaining))
+                    except queue.Empty:
+                        break
+                
+                self._dispatch(batch)
+            except Exception as e:
+                # Keep the worker alive; fail whatever this batch left unresolved
+                logger.exception("Batch dispatch error: %s", e)
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def _dispatch(self, batch):
+        """
+        Run batch_fn once per group of items sharing the same args
+        """
+        groups = {}
+        for item, args, future in batch:
+            # Skip requests whose callers have already given up
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                groups.setdefault(args, []).append((item, future))
+            except TypeError as e:
+                # Unhashable args can't be grouped
+                future.set_exception(e)
+        
+        for args, entries in groups.items():
+            try:
+                results = self.batch_fn([item for item, _ in entries], *args)
+            except Exception as e:
+                logger.exception("Batch processing error: %s", e)
+                for _, future in entries:
+                    future.set_exception(e)
+                continue
+            
+            for (_, future), result in zip(entries, results):
+                future.set_result(result)
@@ -3,30 +3,198 @@ Email Automation Service
 Handles automated email sending using SMTP
 """
 
+import hashlib
 import smtplib
 import ssl
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
+import time
+from email.message import EmailMessage
 import os
+import re
+from collections import ChainMap, OrderedDict
+from string import Template
+import queue
+import threading
 import logging
 
+logger = logging.getLogger(__name__)
+
+# Maximum number of persistent SMTP sessions kept per (server, port, sender, password)
+SMTP_POOL_SIZE = 5
+
+# Seconds to wait for a free pooled session before giving up
+SMTP_POOL_TIMEOUT = 30
+
+# Idle sessions are closed after this many seconds (providers drop them after a few minutes)
+SMTP_IDLE_TIMEOUT = 120
+
+# Maximum number of pools (one per sender and password); the least recently used is closed
+SMTP_MAX_POOLS = 64
+
+# Socket timeout for SMTP connections, in seconds
+SMTP_TIMEOUT = 30
+
+# One TLS context for all connections, so trust anchors are only loaded once
+_SSL_CTX = ssl.create_default_context()
+
+# Common SMTP servers and ports, keyed by sender email domain
+SMTP_SERVERS = {
+    'gmail.com': {'server': 'smtp.gmail.com', 'port': 587},
+    'yahoo.com': {'server': 'smtp.mail.yahoo.com', 'port': 587},
+    'outlook.com': {'server': 'smtp-mail.outlook.com', 'port': 587},
+    'hotmail.com': {'server': 'smtp-mail.outlook.com', 'port': 587},
+    'live.com': {'server': 'smtp-mail.outlook.com', 'port': 587},
+}
+
+# Providers that accept implicit TLS on port 465, which skips the STARTTLS round trip
+SMTP_SSL_SERVERS = {
+    'gmail.com': {'server': 'smtp.gmail.com', 'port': 465, 'ssl': True},
+    'yahoo.com': {'server': 'smtp.mail.yahoo.com', 'port': 465, 'ssl': True},
+}
+
+# Basic email address format check
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Professional email templates: email_type -> (subject, body), each a
+# (Template, defaults) pair; context data takes precedence over the defaults
+EMAIL_TEMPLATES = {
+    'meeting_request': (
+        (Template("Meeting Request: $topic"), {'topic': 'Discussion'}),
+        (Template("""Dear $recipient_name,
+
+I hope this email finds you well. I would like to schedule a meeting to discuss $topic.
+
+Proposed Details:
+- Date: $date
+- Time: $time
+- Duration: $duration
+- Location/Platform: $location
+
+Please let me know if this works for your schedule, or suggest alternative times that would be more convenient.
+
+Thank you for your time and consideration.
+
+Best regards,
+$sender_name"""), {
+            'recipient_name': 'Sir/Madam',
+            'topic': 'important matters',
+            'date': 'To be determined',
+            'time': 'To be determined',
+            'duration': '1 hour',
+            'location': 'To be determined',
+            'sender_name': 'Your Name',
+        }),
+    ),
+    'follow_up': (
+        (Template("Follow-up: $topic"), {'topic': 'Our Previous Discussion'}),
+        (Template("""Dear $recipient_name,
+
+I hope you are doing well. I wanted to follow up on our previous discussion regarding $topic.
+
+$follow_up_message
+
+Please let me know if you need any additional information from my side.
+
+Looking forward to your response.
+
+Best regards,
+$sender_name"""), {
+            'recipient_name': 'Sir/Madam',
+            'topic': 'the matter we discussed',
+            'follow_up_message': 'I wanted to check if you had any updates or if there are any next steps we should take.',
+            'sender_name': 'Your Name',
+        }),
+    ),
+    'introduction': (
+        (Template("Introduction: $sender_name"), {'sender_name': 'Nice to Meet You'}),
+        (Template("""Dear $recipient_name,
+
+I hope this email finds you well. My name is $sender_name, and I am $sender_title.
+
+$introduction_message
+
+I would be happy to schedule a brief call or meeting at your convenience to discuss this further.
+
+Thank you for your time, and I look forward to hearing from you.
+
+Best regards,
+$sender_name
+$sender_contact"""), {
+            'recipient_name': 'Sir/Madam',
+            'sender_name': 'Your Name',
+            'sender_title': 'reaching out to introduce myself',
+            'introduction_message': 'I would like to connect with you and explore potential opportunities for collaboration.',
+            'sender_contact': '',
+        }),
+    ),
+    'thank_you': (
+        (Template("Thank You - $topic"), {'topic': 'Your Assistance'}),
+        (Template("""Dear $recipient_name,
+
+I wanted to take a moment to express my sincere gratitude for $reason.
+
+$thank_you_message
+
+Please don't hesitate to reach out if there's anything I can do to return the favor.
+
+Thank you once again.
+
+Warm regards,
+$sender_name"""), {
+            'recipient_name': 'Sir/Madam',
+            'reason': 'your assistance and support',
+            'thank_you_message': 'Your help has been invaluable and greatly appreciated.',
+            'sender_name': 'Your Name',
+        }),
+    ),
+    'generic': (
+        (Template("$subject"), {'subject': 'Professional Correspondence'}),
+        (Template("""Dear $recipient_name,
+
+$message
+
+Thank you for your time and consideration.
+
+Best regards,
+$sender_name"""), {
+            'recipient_name': 'Sir/Madam',
+            'message': 'I hope this email finds you well.',
+            'sender_name': 'Your Name',
+        }),
+    ),
+}
+
+class _ResumingSSLContext:
+    """
+    SSLContext stand-in that offers a previous TLS session for resumption, so a
+    reconnect can use the abbreviated handshake instead of a full one
+    """
+    def __init__(self, context, session):
+        self._context = context
+        self._session = session
+
+    def wrap_socket(self, sock, **kwargs):
+        kwargs.setdefault('session', self._session)
+        return self._context.wrap_socket(sock, **kwargs)
+
 class EmailService:
     def __init__(self):
         """
         Initialize the email service
         """
-        # Common SMTP servers and ports
-        self.smtp_servers = {
-            'gmail.com': {'server': 'smtp.gmail.com', 'port': 587},
-            'yahoo.com': {'server': 'smtp.mail.yahoo.com', 'port': 587},
-            'outlook.com': {'server': 'smtp-mail.outlook.com', 'port': 587},
-            'hotmail.com': {'server': 'smtp-mail.outlook.com', 'port': 587},
-            'live.com': {'server': 'smtp-mail.outlook.com', 'port': 587},
-        }
+        # Shared SMTP routing tables (implicit TLS preferred where supported)
+        self.smtp_servers = SMTP_SERVERS
+        self.smtp_ssl_servers = SMTP_SSL_SERVERS
+        
+        # Pools of authenticated SMTP sessions keyed by
+        # (server, port, sender_email, password digest), most recently used last
+        self._pools = OrderedDict()
+        self._pools_lock = threading.Lock()
+        self._last_reap = time.monotonic()
+        
+        # Last TLS session per pool key, offered for resumption on reconnect
+        self._tls_sessions = {}
         
-        print("✅ Email Service initialized successfully")
+        logger.info("Email Service initialized successfully")
 
     def send_email(self, sender_email, sender_password, receiver_email, subject, message, attachments=None):
         """
@@ -54,14 +222,14 @@ class EmailService:
             success = self._send_via_smtp(smtp_config, sender_email, sender_password, receiver_email, msg)
             
             if success:
-                print(f"✅ Email sent successfully from {sender_email} to {receiver_email}")
+                logger.info("Email sent successfully from %s to %s", sender_email, receiver_email)
             else:
-                print(f"❌ Failed to send email from {sender_email} to {receiver_email}")
+                logger.error("Failed to send email from %s to %s", sender_email, receiver_email)
             
             return success
             
         except Exception as e:
-            print(f"❌ Email sending error: {e}")
+            logger.exception("Email sending error: %s", e)
             return False
 
     def _get_smtp_config(self, email):
@@ -69,18 +237,21 @@ class EmailService:
         Get SMTP server configuration based on email domain
         """
         try:
-            domain = email.split('@')[1].lower()
+            _, _, domain = email.rpartition('@')
+            domain = domain.lower()
             
-            if domain in self.smtp_servers:
+            if domain in self.smtp_ssl_servers:
+                return self.smtp_ssl_servers[domain]
+            elif domain in self.smtp_servers:
                 return self.smtp_servers[domain]
             else:
                 # Default to Gmail settings
-                print(f"⚠️  Unknown email provider {domain}, using Gmail settings")
-                return self.smtp_servers['gmail.com']
+                logger.warning("Unknown email provider %s, using Gmail settings", domain)
+                return self.smtp_ssl_servers['gmail.com']
                 
         except Exception as e:
-            print(f"⚠️  Error determining SMTP config: {e}")
-            return self.smtp_servers['gmail.com']
+            logger.warning("Error determining SMTP config: %s", e)
+            return self.smtp_ssl_servers['gmail.com']
 
     def _create_message(self, sender_email, receiver_email, subject, message, attachments=None):
         """
@@ -88,13 +259,13 @@ class EmailService:
         """
         try:
             # Create message container
-            msg = MIMEMultipart()
+            msg = EmailMessage()
             msg['From'] = sender_email
             msg['To'] = receiver_email
             msg['Subject'] = subject
             
             # Add body to email
-            msg.attach(MIMEText(message, 'plain'))
+            msg.set_content(message)
             
             # Add attachments if provided
             if attachments:
@@ -102,12 +273,12 @@ class EmailService:
                     if os.path.exists(file_path):
                         self._add_attachment(msg, file_path)
                     else:
-                        print(f"⚠️  Attachment not found: {file_path}")
+                        logger.warning("Attachment not found: %s", file_path)
             
             return msg
             
         except Exception as e:
-            print(f"❌ Error creating message: {e}")
+            logger.exception("Error creating message: %s", e)
             raise
 
     def _add_attachment(self, msg, file_path):
@@ -116,64 +287,236 @@ class EmailService:
         """
         try:
             with open(file_path, "rb") as attachment:
-                # Create MIMEBase object
-                part = MIMEBase('application', 'octet-stream')
-                part.set_payload(attachment.read())
+                data = attachment.read()
             
-            # Encode file in ASCII characters to send by email
-            encoders.encode_base64(part)
-            
-            # Add header with filename
-            filename = os.path.basename(file_path)
-            part.add_header(
-                'Content-Disposition',
-                f'attachment; filename= {filename}',
+            # EmailMessage handles the base64 transfer encoding and headers itself,
+            # so the file contents are only held once before serialization
+            msg.add_attachment(
+                data,
+                maintype='application',
+                subtype='octet-stream',
+                filename=os.path.basename(file_path)
             )
             
-            # Attach the part to message
-            msg.attach(part)
-            
         except Exception as e:
-            print(f"⚠️  Error adding attachment {file_path}: {e}")
+            logger.warning("Error adding attachment %s: %s", file_path, e)
 
-    def _send_via_smtp(self, smtp_config, sender_email, sender_password, receiver_email, msg):
+    def _get_pool(self, key):
         """
-        Send email via SMTP server
+        Get (or lazily create) the connection pool for a pool key
         """
+        evicted = None
+        with self._pools_lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                # Each slot holds either an idle (session, last_used) pair or None
+                # (free to connect); LIFO so the most recently used session is handed out first
+                pool = queue.LifoQueue(maxsize=SMTP_POOL_SIZE)
+                for _ in range(SMTP_POOL_SIZE):
+                    pool.put(None)
+                self._pools[key] = pool
+                
+                if len(self._pools) > SMTP_MAX_POOLS:
+                    evicted_key, evicted = self._pools.popitem(last=False)
+                    self._tls_sessions.pop(evicted_key, None)
+            else:
+                self._pools.move_to_end(key)
+        
+        if evicted is not None:
+            # Sessions still in use are closed when they are released
+            self._close_idle(evicted, max_idle=0)
+        self._reap_idle()
+        
+        return pool
+
+    def _acquire(self, key, smtp_config, sender_email, sender_password):
+        """
+        Take a live, authenticated SMTP session from the pool, connecting if needed
+        """
+        pool = self._get_pool(key)
+        
+        # Blocks when all sessions for this key are in use (backpressure)
+        slot = pool.get(timeout=SMTP_POOL_TIMEOUT)
+        server = None
+        
         try:
-            # Create SMTP session
-            server = smtplib.SMTP(smtp_config['server'], smtp_config['port'])
-            
-            # Enable security
-            server.starttls()
-            
-            # Login with sender's email and password
-            server.login(sender_email, sender_password)
+            if slot is not None:
+                server, last_used = slot
+                if time.monotonic() - last_used > SMTP_IDLE_TIMEOUT or not self._is_alive(server):
+                    self._close_quietly(server)
+                    server = None
             
-            # Convert message to string
-            text = msg.as_string()
+            if server is None:
+                context = self._tls_context(key)
+                
+                if smtp_config.get('ssl'):
+                    # Implicit TLS: the connection is encrypted from the first byte
+                    server = smtplib.SMTP_SSL(
+                        smtp_config['server'], smtp_config['port'],
+                        timeout=SMTP_TIMEOUT, context=context
+                    )
+                else:
+                    server = smtplib.SMTP(smtp_config['server'], smtp_config['port'], timeout=SMTP_TIMEOUT)
+                    server.starttls(context=context)
+                server.login(sender_email, sender_password)
+                
+                self._remember_tls_session(key, server)
             
-            # Send email
-            server.sendmail(sender_email, receiver_email, text)
+            return server
             
-            # Terminate the SMTP session
+        except Exception:
+            # Give the slot back so the pool does not shrink on failed connects
+            if server is not None:
+                self._close_quietly(server)
+            pool.put(None)
+            raise
+
+    def _tls_context(self, key):
+        """
+        TLS context for a new connection, resuming this key's last session if known
+        """
+        with self._pools_lock:
+            session = self._tls_sessions.get(key)
+        
+        return _ResumingSSLContext(_SSL_CTX, session) if session is not None else _SSL_CTX
+
+    def _remember_tls_session(self, key, server):
+        """
+        Store the TLS session of a freshly authenticated connection for later resumption
+        """
+        # With TLS 1.3 the session ticket arrives after the handshake, so read it post-login
+        session = getattr(getattr(server, 'sock', None), 'session', None)
+        if session is not None:
+            with self._pools_lock:
+                # Not for pools evicted in the meantime
+                if key in self._pools:
+                    self._tls_sessions[key] = session
+
+    def _release(self, key, server, discard=False):
+        """
+        Return an SMTP session to its pool, or drop it if it is no longer usable
+        """
+        with self._pools_lock:
+            pool = self._pools.get(key)
+        
+        if discard or pool is None:
+            # Broken, or its pool was evicted while the session was in use
+            self._close_quietly(server)
+        
+        if pool is not None:
+            pool.put(None if discard else (server, time.monotonic()))
+
+    def _is_alive(self, server):
+        """
+        Check whether a pooled SMTP session is still connected
+        """
+        try:
+            return server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _close_quietly(self, server):
+        """
+        Close an SMTP session, ignoring errors from already-dead connections
+        """
+        try:
             server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+    def close_connections(self):
+        """
+        Close all idle pooled SMTP sessions
+        """
+        with self._pools_lock:
+            pools = list(self._pools.values())
+        
+        for pool in pools:
+            self._close_idle(pool, max_idle=0)
+
+    def _reap_idle(self):
+        """
+        Close sessions idle for longer than SMTP_IDLE_TIMEOUT, at most every half timeout
+        """
+        with self._pools_lock:
+            now = time.monotonic()
+            if now - self._last_reap < SMTP_IDLE_TIMEOUT / 2:
+                return
+            self._last_reap = now
+            pools = list(self._pools.values())
+        
+        for pool in pools:
+            self._close_idle(pool, max_idle=SMTP_IDLE_TIMEOUT)
+
+    def _close_idle(self, pool, max_idle):
+        """
+        Close the idle sessions of a pool that have been unused for more than max_idle seconds
+        """
+        # Drain first: with a LIFO pool, refilling as we go would re-read the same slot
+        drained = []
+        while True:
+            try:
+                drained.append(pool.get_nowait())
+            except queue.Empty:
+                break
+        
+        now = time.monotonic()
+        for slot in drained:
+            if slot is not None and now - slot[1] >= max_idle:
+                self._close_quietly(slot[0])
+                slot = None
+            pool.put(slot)
+
+    def _send_via_smtp(self, smtp_config, sender_email, sender_password, receiver_email, msg):
+        """
+        Send email via a pooled SMTP session
+        """
+        # Sessions are only reused for the exact credentials they logged in with
+        password_digest = hashlib.sha256(sender_password.encode('utf-8')).hexdigest()
+        key = (smtp_config['server'], smtp_config['port'], sender_email, password_digest)
+        server = None
+        healthy = False
+        
+        try:
+            server = self._acquire(key, smtp_config, sender_email, sender_password)
             
+            try:
+                # Send email (serializes straight to the socket, no as_string() copy)
+                server.send_message(msg, sender_email, [receiver_email])
+            except smtplib.SMTPServerDisconnected:
+                # Pooled session was dropped after the liveness check; reconnect once
+                self._release(key, server, discard=True)
+                server = None
+                server = self._acquire(key, smtp_config, sender_email, sender_password)
+                server.send_message(msg, sender_email, [receiver_email])
+            
+            healthy = True
             return True
             
+        except queue.Empty:
+            logger.error("Timed out waiting for a free SMTP connection.")
+            return False
         except smtplib.SMTPAuthenticationError:
-            print("❌ Authentication failed. Please check your email and password.")
-            print("💡 For Gmail, you may need to use an App Password instead of your regular password.")
+            logger.error(
+                "Authentication failed. Please check your email and password. "
+                "For Gmail, you may need to use an App Password instead of your regular password."
+            )
             return False
         except smtplib.SMTPRecipientsRefused:
-            print("❌ Recipient email address was refused by the server.")
+            # The session itself is still usable
+            healthy = True
+            logger.error("Recipient email address was refused by the server.")
             return False
         except smtplib.SMTPServerDisconnected:
-            print("❌ Server unexpectedly disconnected.")
+            logger.error("Server unexpectedly disconnected.")
             return False
         except Exception as e:
-            print(f"❌ SMTP error: {e}")
+            logger.exception("SMTP error: %s", e)
             return False
+        finally:
+            # Return the session to the pool instead of quitting it
+            if server is not None:
+                self._release(key, server, discard=not healthy)
 
     def generate_professional_email(self, email_type, context_data):
         """
@@ -187,97 +530,27 @@ class EmailService:
             dict: Generated email with subject and body
         """
         try:
-            templates = {
-                'meeting_request': {
-                    'subject': f"Meeting Request: {context_data.get('topic', 'Discussion')}",
-                    'body': f"""Dear {context_data.get('recipient_name', 'Sir/Madam')},
-
-I hope this email finds you well. I would like to schedule a meeting to discuss {context_data.get('topic', 'important matters')}.
-
-Proposed Details:
-- Date: {context_data.get('date', 'To be determined')}
-- Time: {context_data.get('time', 'To be determined')}
-- Duration: {context_data.get('duration', '1 hour')}
-- Location/Platform: {context_data.get('location', 'To be determined')}
-
-Please let me know if this works for your schedule, or suggest alternative times that would be more convenient.
-
-Thank you for your time and consideration.
-
-Best regards,
-{context_data.get('sender_name', 'Your Name')}"""
-                },
-                'follow_up': {
-                    'subject': f"Follow-up: {context_data.get('topic', 'Our Previous Discussion')}",
-                    'body': f"""Dear {context_data.get('recipient_name', 'Sir/Madam')},
-
-I hope you are doing well. I wanted to follow up on our previous discussion regarding {context_data.get('topic', 'the matter we discussed')}.
-
-{context_data.get('follow_up_message', 'I wanted to check if you had any updates or if there are any next steps we should take.')}
-
-Please let me know if you need any additional information from my side.
-
-Looking forward to your response.
-
-Best regards,
-{context_data.get('sender_name', 'Your Name')}"""
-                },
-                'introduction': {
-                    'subject': f"Introduction: {context_data.get('sender_name', 'Nice to Meet You')}",
-                    'body': f"""Dear {context_data.get('recipient_name', 'Sir/Madam')},
-
-I hope this email finds you well. My name is {context_data.get('sender_name', 'Your Name')}, and I am {context_data.get('sender_title', 'reaching out to introduce myself')}.
-
-{context_data.get('introduction_message', 'I would like to connect with you and explore potential opportunities for collaboration.')}
-
-I would be happy to schedule a brief call or meeting at your convenience to discuss this further.
-
-Thank you for your time, and I look forward to hearing from you.
-
-Best regards,
-{context_data.get('sender_name', 'Your Name')}
-{context_data.get('sender_contact', '')}"""
-                },
-                'thank_you': {
-                    'subject': f"Thank You - {context_data.get('topic', 'Your Assistance')}",
-                    'body': f"""Dear {context_data.get('recipient_name', 'Sir/Madam')},
-
-I wanted to take a moment to express my sincere gratitude for {context_data.get('reason', 'your assistance and support')}.
-
-{context_data.get('thank_you_message', 'Your help has been invaluable and greatly appreciated.')}
-
-Please don't hesitate to reach out if there's anything I can do to return the favor.
-
-Thank you once again.
-
-Warm regards,
-{context_data.get('sender_name', 'Your Name')}"""
-                }
-            }
+            subject_template, body_template = EMAIL_TEMPLATES.get(email_type, EMAIL_TEMPLATES['generic'])
             
-            if email_type in templates:
-                return templates[email_type]
-            else:
-                # Generic template
-                return {
-                    'subject': context_data.get('subject', 'Professional Correspondence'),
-                    'body': f"""Dear {context_data.get('recipient_name', 'Sir/Madam')},
-
-{context_data.get('message', 'I hope this email finds you well.')}
-
-Thank you for your time and consideration.
-
-Best regards,
-{context_data.get('sender_name', 'Your Name')}"""
-                }
+            return {
+                'subject': self._fill_template(subject_template, context_data),
+                'body': self._fill_template(body_template, context_data)
+            }
                 
         except Exception as e:
-            print(f"❌ Error generating email template: {e}")
+            logger.exception("Error generating email template: %s", e)
             return {
                 'subject': 'Professional Email',
                 'body': f"Dear Sir/Madam,\n\n{context_data.get('message', 'Thank you for your time.')}\n\nBest regards,\n{context_data.get('sender_name', 'Your Name')}"
             }
 
+    def _fill_template(self, template, context_data):
+        """
+        Substitute context data into a (template, defaults) pair
+        """
+        text, defaults = template
+        return text.safe_substitute(ChainMap(context_data, defaults))
+
     def validate_email_address(self, email):
         """
         Basic email validation
@@ -289,9 +562,7 @@ Best regards,
             bool: True if email format is valid
         """
         try:
-            import re
-            pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            return bool(re.match(pattern, email))
+            return _EMAIL_RE.match(email) is not None
         except Exception:
             return False
 
@@ -3,15 +3,33 @@ Text Summarization Service
 Uses fallback extraction-based summarization when AI models are not available
 """
 
+import logging
+
+logger = logging.getLogger(__name__)
+
 try:
     from transformers import pipeline
     TRANSFORMERS_AVAILABLE = True
 except ImportError:
     TRANSFORMERS_AVAILABLE = False
-    print("⚠️ Transformers not available, using fallback summarization")
+    logger.warning("Transformers not available, using fallback summarization")
 
-import logging
+try:
+    import numpy as np
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+    logger.warning("scikit-learn not available, using keyword-based fallback summarization")
+
+import contextlib
+import hashlib
+import itertools
+import os
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # Length configuration mapping
 LENGTH_CONFIGS = {
@@ -20,35 +38,256 @@ LENGTH_CONFIGS = {
     'long': {'min_length': 300, 'max_length': 500}     # ~150-250 words
 }
 
+SUMMARY_STYLES = ('paragraph', 'bullet', 'abstract')
+
+# Texts longer than this (in characters) are chunked, so summarize_batch
+# can't batch them and summarizes them one at a time
+CHUNK_THRESHOLD_CHARS = 1000
+
+# Number of recent summaries kept per TextSummarizer
+SUMMARY_CACHE_SIZE = 128
+
+# Long texts are split into overlapping windows that fit the model's 1024-token input
+CHUNK_TOKENS = 900
+CHUNK_OVERLAP_TOKENS = 50
+
+# Chunks of one long text summarized concurrently instead of in one batched call
+CHUNK_WORKERS = int(os.environ.get('SUMMARIZER_CHUNK_WORKERS', '1'))
+
+# Fallback summarizer: sentence boundaries and the keywords that mark important sentences
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+')
+_IMPORTANT = re.compile(r'\b(important|significant|key|main|primary|essential|crucial)\b', re.IGNORECASE)
+
+# Model tiers: 'fast' (distilled, ~2x faster) is the default, 'quality' is opt-in
+MODEL_TIERS = {
+    'fast': 'sshleifer/distilbart-cnn-12-6',
+    'quality': 'facebook/bart-large-cnn'
+}
+DEFAULT_MODEL_TIER = 'fast'
+
+# Summarization pipelines are loaded on first use and shared by every TextSummarizer,
+# keyed by model name (None is cached for models that failed to load)
+_PIPELINES = {}
+_PIPELINE_LOCK = threading.Lock()
+
+def _load_quantized_pipeline(model_name):
+    """
+    Load a summarization pipeline with 8-bit weights, or return None if unsupported
+    
+    Uses bitsandbytes on CUDA GPUs and OpenVINO (optimum-intel) on CPU; the int8
+    weights move a quarter of the bytes per decode step compared to FP32.
+    """
+    try:
+        import torch
+        from transformers import AutoTokenizer
+        
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        
+        if torch.cuda.is_available():
+            from transformers import AutoModelForSeq2SeqLM, BitsAndBytesConfig
+            model = AutoModelForSeq2SeqLM.from_pretrained(
+                model_name,
+                quantization_config=BitsAndBytesConfig(load_in_8bit=True),
+                device_map="auto"
+            )
+        else:
+            from optimum.intel import OVModelForSeq2SeqLM
+            model = OVModelForSeq2SeqLM.from_pretrained(model_name, export=True, load_in_8bit=True)
+        
+        return pipeline("summarization", model=model, tokenizer=tokenizer)
+        
+    except Exception as e:
+        logger.warning("INT8 model unavailable for %s, using FP32: %s", model_name, e)
+        return None
+
+def _load_onnx_pipeline(model_name):
+    """
+    Load a summarization pipeline on ONNX Runtime, or return None if unavailable
+    
+    Uses the pre-exported (ideally INT8-quantized) model in SUMMARIZER_ONNX_PATH
+    when set, otherwise exports model_name to ONNX at load time.
+    """
+    try:
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+        
+        # Full graph optimizations (op fusion, constant folding) across all cores
+        session_options = ort.SessionOptions()
+        session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        session_options.intra_op_num_threads = os.cpu_count()
+        session_options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        session_options.add_session_config_entry("session.dynamic_block_base", "4")
+        
+        provider = os.environ.get('SUMMARIZER_ORT_PROVIDER', 'CPUExecutionProvider')
+        
+        onnx_path = os.environ.get('SUMMARIZER_ONNX_PATH')
+        if onnx_path:
+            model = ORTModelForSeq2SeqLM.from_pretrained(
+                onnx_path, session_options=session_options, provider=provider
+            )
+            tokenizer = AutoTokenizer.from_pretrained(onnx_path)
+        else:
+            model = ORTModelForSeq2SeqLM.from_pretrained(
+                model_name, export=True, session_options=session_options, provider=provider
+            )
+            tokenizer = AutoTokenizer.from_pretrained(model_name)
+        
+        return pipeline("summarization", model=model, tokenizer=tokenizer)
+        
+    except Exception as e:
+        logger.warning("ONNX Runtime model unavailable for %s, using PyTorch: %s", model_name, e)
+        return None
+
+def _optimize_model(model):
+    """
+    Swap in fused attention kernels and optionally compile the model
+    
+    BetterTransformer routes attention through fused scaled-dot-product kernels;
+    torch.compile (opt-in via SUMMARIZER_COMPILE) additionally fuses the remaining
+    ops. Each step is skipped if the installed libraries don't support the model.
+    """
+    try:
+        from optimum.bettertransformer import BetterTransformer
+        model = BetterTransformer.transform(model)
+    except Exception as e:
+        logger.warning("BetterTransformer unavailable, using eager attention: %s", e)
+    
+    if os.environ.get('SUMMARIZER_COMPILE', 'False').lower() in ('1', 'true'):
+        try:
+            import torch
+            # Compile forward in place: generate() runs on the module itself, so an
+            # OptimizedModule wrapper would forward it to the uncompiled model
+            model.forward = torch.compile(model.forward, mode="reduce-overhead", fullgraph=False)
+        except Exception as e:
+            logger.warning("torch.compile failed, using uncompiled model: %s", e)
+    
+    return model
+
+def _load_model_pipeline(model_name):
+    """
+    Load a summarization pipeline, preferring 8-bit weights unless disabled
+    
+    SUMMARIZER_BACKEND=onnx selects ONNX Runtime, which is usually the fastest
+    option on CPU-only hosts.
+    """
+    if os.environ.get('SUMMARIZER_BACKEND', 'torch').lower() == 'onnx':
+        summarizer = _load_onnx_pipeline(model_name)
+        if summarizer is not None:
+            return summarizer
+    
+    if os.environ.get('SUMMARIZER_QUANTIZE', 'True').lower() in ('1', 'true'):
+        summarizer = _load_quantized_pipeline(model_name)
+        if summarizer is not None:
+            return summarizer
+    
+    summarizer = pipeline("summarization", model=model_name, tokenizer=model_name)
+    summarizer.model = _optimize_model(summarizer.model)
+    return summarizer
+
+def _inference_mode():
+    """
+    torch.inference_mode() when torch is installed, otherwise a no-op context
+    """
+    try:
+        import torch
+        return torch.inference_mode()
+    except ImportError:
+        return contextlib.nullcontext()
+
+def _load_pipeline(model_name):
+    """
+    Load the summarization model, falling back to the fast model if needed
+    """
+    try:
+        # Load pre-trained summarization model from Hugging Face
+        summarizer = _load_model_pipeline(model_name)
+        logger.info("Text Summarizer model loaded successfully: %s", model_name)
+        return summarizer
+    except Exception as e:
+        fallback_name = MODEL_TIERS[DEFAULT_MODEL_TIER]
+        if model_name == fallback_name:
+            logger.error("Failed to initialize text summarizer: %s", e)
+            return None
+        
+        # Fallback to the smaller model if the requested one fails
+        logger.warning("Model %s failed, trying fallback: %s", model_name, e)
+        try:
+            summarizer = _load_model_pipeline(fallback_name)
+            logger.info("Fallback Text Summarizer model loaded successfully")
+            return summarizer
+        except Exception as e2:
+            logger.error("Failed to initialize text summarizer: %s", e2)
+            return None
+
 class TextSummarizer:
-    def __init__(self):
+    # Only the first instance announces itself
+    _initialized = False
+
+    def __init__(self, model_tier=None):
         """
-        Initialize the text summarization model
+        Initialize the text summarizer
+        
+        The model itself is loaded lazily on first use, so processes that never
+        summarize don't pay for loading its weights.
+        
+        Args:
+            model_tier (str): 'fast' (default) or 'quality', or a Hugging Face model
+                name; defaults to the SUMMARIZER_MODEL environment variable
         """
-        self.summarizer = None
+        model_tier = model_tier or os.environ.get('SUMMARIZER_MODEL', DEFAULT_MODEL_TIER)
+        self.model_name = MODEL_TIERS.get(model_tier, model_tier)
+        self._summarizer = None
         
-        if TRANSFORMERS_AVAILABLE:
-            try:
-                # Load pre-trained summarization model from Hugging Face
-                self.summarizer = pipeline(
-                    "summarization",
-                    model="facebook/bart-large-cnn",
-                    tokenizer="facebook/bart-large-cnn"
-                )
-                print("✅ Text Summarizer initialized successfully")
-            except Exception as e:
-                # Fallback to a smaller model if the main one fails
-                print(f"⚠️  Main model failed, trying fallback: {e}")
-                try:
-                    self.summarizer = pipeline("summarization", model="sshleifer/distilbart-cnn-12-6")
-                    print("✅ Fallback Text Summarizer initialized successfully")
-                except Exception as e2:
-                    print(f"❌ Failed to initialize text summarizer: {e2}")
-                    self.summarizer = None
-        else:
-            print("✅ Text Summarizer initialized with extraction-based method")
+        # LRU cache of (text digest, length, style) -> summary
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        if not TextSummarizer._initialized:
+            TextSummarizer._initialized = True
+            if TRANSFORMERS_AVAILABLE:
+                logger.info("Text Summarizer initialized (model loads on first use)")
+            else:
+                logger.info("Text Summarizer initialized with extraction-based method")
+
+    @property
+    def summarizer(self):
+        """
+        The summarization pipeline (or None when unavailable), loaded on first access
+        """
+        if self._summarizer is not None:
+            return self._summarizer
+        
+        if not TRANSFORMERS_AVAILABLE:
+            return None
+        
+        if self.model_name not in _PIPELINES:
+            with _PIPELINE_LOCK:
+                if self.model_name not in _PIPELINES:
+                    _PIPELINES[self.model_name] = _load_pipeline(self.model_name)
+        
+        return _PIPELINES[self.model_name]
+
+    @summarizer.setter
+    def summarizer(self, value):
+        # Allows plugging in a custom pipeline for this instance
+        self._summarizer = value
 
-    def summarize(self, text, length='medium', style='paragraph'):
+    @property
+    def tokenizer(self):
+        """
+        The pipeline's (fast, Rust-backed) tokenizer, or None when unavailable
+        """
+        return getattr(self.summarizer, 'tokenizer', None)
+
+    def _generate(self, inputs, **kwargs):
+        """
+        Run the summarization pipeline without autograd bookkeeping
+        """
+        with _inference_mode():
+            return self.summarizer(inputs, **kwargs)
+
+    def summarize(self, text, length='medium', style='paragraph', max_length=None, min_length=None):
         """
         Summarize the given text using AI
         
@@ -56,47 +295,92 @@ class TextSummarizer:
             text (str): Input text to summarize
             length (str): Summary length - 'short', 'medium', or 'long'
             style (str): Summary style - 'paragraph', 'bullet', or 'abstract'
-            
+            max_length (int): Optional explicit maximum summary length in tokens,
+                overriding the one implied by length
+            min_length (int): Optional explicit minimum summary length in tokens
+        
         Returns:
             str: Summarized text
         """
+        key = self._cache_key(text, length, style, max_length, min_length)
+        summary = self._cache_get(key)
+        if summary is None:
+            summary, from_model = self._summarize(text, length, style, max_length, min_length)
+            # Fallback output (no model, or a transient model error) isn't cached
+            if from_model:
+                self._cache_put(key, summary)
+        return summary
+
+    def _cache_key(self, text, length, style, max_length=None, min_length=None):
+        """
+        Cache key for a request; the text is stored only as a fixed-size digest
+        """
+        digest = hashlib.blake2b(text.strip().encode('utf-8'), digest_size=16).hexdigest()
+        return (digest, length, style, max_length, min_length)
+
+    def _cache_get(self, key):
+        """
+        Return a cached summary (marking it most recently used), or None
+        """
+        with self._cache_lock:
+            summary = self._cache.get(key)
+            if summary is not None:
+                self._cache.move_to_end(key)
+            return summary
+
+    def _cache_put(self, key, summary):
+        """
+        Store a summary, evicting the least recently used one when full
+        """
+        with self._cache_lock:
+            self._cache[key] = summary
+            self._cache.move_to_end(key)
+            if len(self._cache) > SUMMARY_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    def _summarize(self, text, length, style, max_length=None, min_length=None):
+        """
+        Summarize text without consulting the cache
+        
+        Returns:
+            tuple: (summary, whether the model produced it)
+        """
         try:
             if not self.summarizer:
                 summary = self._fallback_summarize(text)
-                return self._format_summary(summary, style)
+                return self._format_summary(summary, style), False
             
             # Get length configuration
             length_config = LENGTH_CONFIGS.get(length, LENGTH_CONFIGS['medium'])
-            max_length = length_config['max_length']
-            min_length = length_config['min_length']
+            max_length = max_length or length_config['max_length']
+            min_length = min(min_length or length_config['min_length'], max_length)
             
             # Clean and prepare text
             text = text.strip()
             
             # Handle very long texts by chunking
-            if len(text) > 1000:
-                # Split into chunks and summarize each
-                chunks = self._split_text(text, 1000)
-                summaries = []
+            if len(text) > CHUNK_THRESHOLD_CHARS:
+                # Split into model-sized chunks, skipping very short ones
+                if self.tokenizer is not None:
+                    chunks = self._split_tokens(text)
+                else:
+                    chunks = self._split_text(text, 1000)
+                chunks = [chunk for chunk in chunks if len(chunk.strip()) >= 50]
                 
-                for chunk in chunks:
-                    if len(chunk.strip()) < 50:  # Skip very short chunks
-                        continue
-                    
-                    result = self.summarizer(
-                        chunk,
-                        max_length=max_length,
-                        min_length=min(min_length, len(chunk.split())//4),
-                        do_sample=False
-                    )
-                    summaries.append(result[0]['summary_text'])
+                summaries = self._summarize_chunks(chunks, max_length, min_length)
                 
                 # Combine all summaries
                 combined_summary = " ".join(summaries)
                 
-                # If combined summary is still too long, summarize it again
-                if len(combined_summary) > max_length * 2:
-                    final_result = self.summarizer(
+                # If combined summary is still over the generation budget, summarize it again
+                # (counted in model tokens, like max_length, when a tokenizer is available)
+                if self.tokenizer is not None:
+                    too_long = len(self.tokenizer.encode(combined_summary)) > max_length * 1.3
+                else:
+                    too_long = len(combined_summary) > max_length * 2
+                
+                if too_long:
+                    final_result = self._generate(
                         combined_summary,
                         max_length=max_length,
                         min_length=min_length,
@@ -107,7 +391,7 @@ class TextSummarizer:
                     summary = combined_summary
             else:
                 # Summarize directly for shorter texts
-                result = self.summarizer(
+                result = self._generate(
                     text,
                     max_length=max_length,
                     min_length=min(min_length, len(text.split())//4),
@@ -116,11 +400,116 @@ class TextSummarizer:
                 summary = result[0]['summary_text']
             
             # Apply style formatting
-            return self._format_summary(summary, style)
-                
+            return self._format_summary(summary, style), True
+        
         except Exception as e:
-            print(f"❌ Summarization error: {e}")
-            return self._fallback_summarize(text)
+            logger.exception("Summarization error: %s", e)
+            return self._fallback_summarize(text), False
+
+    def _summarize_chunks(self, chunks, max_length, min_length):
+        """
+        Summarize the chunks of one long text
+        
+        By default all chunks go through one batched pipeline call. With
+        SUMMARIZER_CHUNK_WORKERS > 1 (for CPU backends such as ONNX Runtime that
+        release the GIL but gain little from padded batches) chunks are instead
+        summarized concurrently, one per call.
+        """
+        if CHUNK_WORKERS > 1 and len(chunks) > 1:
+            def summarize_chunk(chunk):
+                result = self._generate(
+                    chunk,
+                    max_length=max_length,
+                    min_length=min(min_length, len(chunk.split())//4),
+                    do_sample=False,
+                    truncation=True
+                )
+                return result[0]['summary_text']
+            
+            with ThreadPoolExecutor(max_workers=min(CHUNK_WORKERS, len(chunks))) as executor:
+                return list(executor.map(summarize_chunk, chunks))
+        
+        # One batched call; kwargs are shared, so use the shortest chunk's min_length bound
+        results = self._generate(
+            chunks,
+            max_length=max_length,
+            min_length=min(min_length, min(len(chunk.split()) for chunk in chunks)//4),
+            do_sample=False,
+            batch_size=min(8, len(chunks)),
+            truncation=True
+        )
+        return [result['summary_text'] for result in results]
+
+    def summarize_batch(self, texts, length='medium', style='paragraph', micro_batch_size=8):
+        """
+        Summarize several texts that share the same length and style options
+        
+        Texts short enough to skip chunking are sorted by length and sent to the
+        model in micro-batches of similar length, so little compute is spent on
+        padding; longer texts go through summarize() one at a time.
+        
+        Args:
+            texts (list): Input texts to summarize
+            length (str): Summary length - 'short', 'medium', or 'long'
+            style (str): Summary style - 'paragraph', 'bullet', or 'abstract'
+            micro_batch_size (int): Maximum number of texts per model call
+        
+        Returns:
+            list: Summaries, in the same order as texts
+        """
+        if not self.summarizer:
+            return [self.summarize(text, length=length, style=style) for text in texts]
+        
+        summaries = [None] * len(texts)
+        batch_indices = []
+        
+        for i, text in enumerate(texts):
+            if len(text.strip()) > CHUNK_THRESHOLD_CHARS:
+                summaries[i] = self.summarize(text, length=length, style=style)
+            else:
+                summaries[i] = self._cache_get(self._cache_key(text, length, style))
+                if summaries[i] is None:
+                    batch_indices.append(i)
+        
+        # Get length configuration
+        length_config = LENGTH_CONFIGS.get(length, LENGTH_CONFIGS['medium'])
+        max_length = length_config['max_length']
+        
+        # Pipeline kwargs are shared by the whole call, so only texts with the same
+        # min_length bound as summarize() would use go into one micro-batch
+        def text_min_length(i):
+            return min(length_config['min_length'], len(texts[i].strip().split()) // 4)
+        
+        # Bucket by bound, then length; results are written back to their original positions
+        batch_indices.sort(key=lambda i: (text_min_length(i), len(texts[i])))
+        buckets = []
+        for min_length, group in itertools.groupby(batch_indices, key=text_min_length):
+            group = list(group)
+            for start in range(0, len(group), micro_batch_size):
+                buckets.append((min_length, group[start:start + micro_batch_size]))
+        
+        for min_length, bucket in buckets:
+            batch = [texts[i].strip() for i in bucket]
+            
+            try:
+                results = self._generate(
+                    batch,
+                    max_length=max_length,
+                    min_length=min_length,
+                    do_sample=False,
+                    batch_size=len(batch)
+                )
+                
+                for i, result in zip(bucket, results):
+                    summaries[i] = self._format_summary(result['summary_text'], style)
+                    self._cache_put(self._cache_key(texts[i], length, style), summaries[i])
+            
+            except Exception as e:
+                logger.exception("Batch summarization error: %s", e)
+                for i in bucket:
+                    summaries[i] = self._fallback_summarize(texts[i])
+        
+        return summaries
 
     def _format_summary(self, summary, style):
         """
@@ -129,7 +518,7 @@ class TextSummarizer:
         Args:
             summary (str): The raw summary text
             style (str): The desired style - 'paragraph', 'bullet', or 'abstract'
-            
+        
         Returns:
             str: Formatted summary
         """
@@ -164,43 +553,79 @@ class TextSummarizer:
             # Unknown style, return as paragraph
             return summary
 
-    def _split_text(self, text, chunk_size):
+    def _split_tokens(self, text, window=CHUNK_TOKENS, overlap=CHUNK_OVERLAP_TOKENS):
         """
-        Split text into chunks for processing
+        Split text into overlapping windows of at most `window` model tokens
+        
+        Tokenizing once with the model's own tokenizer sizes chunks by what the
+        model actually sees, instead of by character count.
         """
-        words = text.split()
-        chunks = []
-        current_chunk = []
-        current_length = 0
-        
-        for word in words:
-            current_length += len(word) + 1
-            if current_length > chunk_size:
-                chunks.append(" ".join(current_chunk))
-                current_chunk = [word]
-                current_length = len(word)
-            else:
-                current_chunk.append(word)
+        ids = self.tokenizer.encode(text, add_special_tokens=False)
+        step = window - overlap
         
-        if current_chunk:
-            chunks.append(" ".join(current_chunk))
+        chunks = []
+        for start in range(0, max(len(ids) - overlap, 1), step):
+            chunks.append(self.tokenizer.decode(ids[start:start + window], skip_special_tokens=True))
         
         return chunks
 
+    def _split_text(self, text, chunk_size):
+        """
+        Split text into chunks of at most chunk_size characters for processing
+        
+        Chunks end at the last space before the limit and are yielded as slices
+        of text, without building an intermediate list of words.
+        """
+        pos = 0
+        while pos < len(text):
+            end = min(pos + chunk_size, len(text))
+            next_pos = end
+            if end < len(text):
+                cut = text.rfind(' ', pos + 1, end + 1)
+                if cut > pos:
+                    end, next_pos = cut, cut + 1
+            
+            yield text[pos:end]
+            pos = next_pos
+
+    def _tfidf_summarize(self, sentences, num_sentences):
+        """
+        Pick the num_sentences sentences with the highest total TF-IDF weight
+        
+        Returns:
+            str: Selected sentences in their original order, or None if the
+                sentences have no scorable terms
+        """
+        try:
+            weights = TfidfVectorizer(stop_words='english').fit_transform(sentences)
+        except ValueError:
+            # Only stop words (empty vocabulary)
+            return None
+        
+        scores = np.asarray(weights.sum(axis=1)).ravel()
+        top_idx = sorted(np.argpartition(-scores, num_sentences)[:num_sentences])
+        return ' '.join(sentences[i] for i in top_idx)
+
     def _fallback_summarize(self, text, ratio=0.3):
         """
         Fallback summarization using simple sentence extraction
         """
         try:
-            sentences = text.split('. ')
+            sentences = [sentence for sentence in _SENT_SPLIT.split(text.strip()) if sentence]
             if len(sentences) <= 3:
                 return text
             
             # Take first sentence, some middle sentences, and last sentence
             num_sentences = max(2, int(len(sentences) * ratio))
             
+            if SKLEARN_AVAILABLE:
+                summary = self._tfidf_summarize(sentences, num_sentences)
+                if summary:
+                    return summary
+            
             # Take first sentence
             summary_sentences = [sentences[0]]
+            seen = {sentences[0]}
             
             # Take some sentences from middle
             middle_start = len(sentences) // 3
@@ -208,28 +633,28 @@ class TextSummarizer:
             middle_sentences = sentences[middle_start:middle_end]
             
             # Select sentences with important keywords
-            important_keywords = ['important', 'significant', 'key', 'main', 'primary', 'essential', 'crucial']
             for sentence in middle_sentences:
-                if any(keyword in sentence.lower() for keyword in important_keywords):
+                if sentence not in seen and _IMPORTANT.search(sentence):
+                    seen.add(sentence)
                     summary_sentences.append(sentence)
                     if len(summary_sentences) >= num_sentences - 1:
                         break
             
             # Add more sentences if needed
             for sentence in sentences[1:-1]:
-                if sentence not in summary_sentences:
+                if sentence not in seen:
+                    seen.add(sentence)
                     summary_sentences.append(sentence)
                     if len(summary_sentences) >= num_sentences - 1:
                         break
             
             # Add last sentence if meaningful
-            if len(sentences) > 1 and sentences[-1] not in summary_sentences:
+            if len(sentences) > 1 and sentences[-1] not in seen:
                 summary_sentences.append(sentences[-1])
             
-            return '. '.join(summary_sentences[:num_sentences]) + '.'
-            
+            return ' '.join(summary_sentences[:num_sentences])
+        
         except Exception as e:
-            print(f"❌ Fallback summarization error: {e}")
+            logger.exception("Fallback summarization error: %s", e)
             # Ultimate fallback - return first few sentences
-            sentences = text.split('. ')[:3]
-            return '. '.join(sentences) + '.'
\ No newline at end of file
+            return ' '.join(_SENT_SPLIT.split(text.strip())[:3])
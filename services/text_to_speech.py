@@ -3,35 +3,245 @@ Text-to-Speech Conversion Service
 Uses gTTS (Google Text-to-Speech) for converting text to audio
 """
 
-from gtts import gTTS
+from gtts import gTTS, gTTSError
+import asyncio
+import base64
+import contextlib
+import hashlib
+import logging
 import os
+import queue
+import random
+import re
+import shutil
 import tempfile
+import textwrap
+import threading
+import time
+import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+import requests
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
 try:
     import pygame
     PYGAME_AVAILABLE = True
 except ImportError:
     PYGAME_AVAILABLE = False
-    print("⚠️ Pygame not available, audio playback limited")
+    logger.warning("Pygame not available, audio playback limited")
+try:
+    import edge_tts
+    EDGE_TTS_AVAILABLE = True
+except ImportError:
+    EDGE_TTS_AVAILABLE = False
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
 
-from io import BytesIO
-import logging
+# Posted by the pygame mixer when music playback finishes
+PLAYBACK_END_EVENT = pygame.USEREVENT + 1 if PYGAME_AVAILABLE else None
+PLAYBACK_POLL_MS = 100
+
+# Texts synthesized at once by batch_convert
+BATCH_CONCURRENCY = 4
+HTTP_POOL_SIZE = 16
+HTTP_POOL_PER_HOST = 8
+
+# Longer texts are split into pieces of at most this many characters, which
+# are synthesized in parallel and joined (MP3 frames concatenate cleanly)
+MAX_CHUNK_CHARS = 4800
+
+# Generated speech is cached on disk by content hash (and recent audio bytes in memory)
+TTS_CACHE_DIR = os.environ.get('TTS_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'autoComm', 'tts'))
+TTS_MEMORY_CACHE_SIZE = 256
+
+# Rate limiting for Google's TTS endpoint (shared by all converters): at most
+# MAX_IN_FLIGHT requests at once, starts spaced MIN_REQUEST_INTERVAL seconds
+# apart, and rate-limited (429) requests retried with exponential backoff
+MAX_IN_FLIGHT = BATCH_CONCURRENCY
+MIN_REQUEST_INTERVAL = 0.25
+RETRY_ATTEMPTS = 5
+RETRY_BASE_DELAY = 1.0
+
+# Seconds between checks for a free in-flight slot on the asyncio path
+LIMITER_POLL_INTERVAL = 0.05
+
+# Speech backend: 'gtts' (Google) or 'edge' (Microsoft Edge neural voices, needs edge-tts)
+TTS_BACKEND = os.environ.get('TTS_BACKEND', 'gtts').lower()
+EDGE_SLOW_RATE = '-40%'
+
+# gTTS opens (and closes) a new requests.Session per request; share one pooled
+# keep-alive session instead so parallel synths reuse their connections.
+# Transient connection and server errors are retried by urllib3; 429s are left
+# to _synthesize, which backs off without holding a request slot.
+_SESSION = requests.Session()
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[500, 502, 503, 504],
+    allowed_methods=None,  # gTTS POSTs, which urllib3 doesn't retry by default
+    raise_on_status=False
+)
+_ADAPTER = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=_RETRY)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
+# The pooled and async gTTS paths build requests with gTTS internals (checked against gTTS 2.3-2.5)
+_GTTS_INTERNALS_AVAILABLE = hasattr(gTTS, '_prepare_requests') and hasattr(gTTS, 'GOOGLE_TTS_HEADERS')
+
+# The base64 MP3 payload in a line of gTTS's batchexecute response
+_AUDIO_LINE = re.compile(r'jQ1olc","\[\\"(.*)\\"]')
+
+class _PooledGTTS(gTTS):
+    """
+    gTTS whose requests go through this service's shared session instead of a new one per call
+    
+    Only objects built by this service are affected; other gTTS users in the
+    process keep the library's own behaviour.
+    """
+
+    def stream(self):
+        if not _GTTS_INTERNALS_AVAILABLE:
+            yield from super().stream()
+            return
+        
+        # Same as gTTS: verify=False would otherwise warn on every request
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        
+        for request in self._prepare_requests():
+            try:
+                rsp = _SESSION.send(request, verify=False, proxies=urllib.request.getproxies(),
+                                    timeout=self.timeout)
+                rsp.raise_for_status()
+            except requests.exceptions.HTTPError:
+                raise gTTSError(tts=self, response=rsp)
+            except requests.exceptions.RequestException:
+                raise gTTSError(tts=self)
+            
+            for line in rsp.iter_lines(chunk_size=1024):
+                line = line.decode('utf-8')
+                if 'jQ1olc' in line:
+                    audio = _AUDIO_LINE.search(line)
+                    if not audio:
+                        raise gTTSError(tts=self, response=rsp)
+                    yield base64.b64decode(audio.group(1).encode('ascii'))
 
 class TextToSpeechConverter:
-    def __init__(self):
+    # Read-only, so callers can't mutate the shared mapping
+    SUPPORTED_LANGUAGES = MappingProxyType({
+        'en': 'English',
+        'es': 'Spanish',
+        'fr': 'French',
+        'de': 'German',
+        'it': 'Italian',
+        'pt': 'Portuguese',
+        'ru': 'Russian',
+        'ja': 'Japanese',
+        'ko': 'Korean',
+        'zh': 'Chinese (Mandarin)',
+        'ar': 'Arabic',
+        'hi': 'Hindi',
+        'nl': 'Dutch',
+        'sv': 'Swedish',
+        'da': 'Danish',
+        'no': 'Norwegian',
+        'fi': 'Finnish',
+        'pl': 'Polish',
+        'cs': 'Czech',
+        'sk': 'Slovak',
+        'hu': 'Hungarian',
+        'ro': 'Romanian',
+        'bg': 'Bulgarian',
+        'hr': 'Croatian',
+        'sl': 'Slovenian',
+        'et': 'Estonian',
+        'lv': 'Latvian',
+        'lt': 'Lithuanian'
+    })
+
+    # Edge neural voice for each supported language
+    EDGE_VOICES = MappingProxyType({
+        'en': 'en-US-AriaNeural',
+        'es': 'es-ES-ElviraNeural',
+        'fr': 'fr-FR-DeniseNeural',
+        'de': 'de-DE-KatjaNeural',
+        'it': 'it-IT-ElsaNeural',
+        'pt': 'pt-BR-FranciscaNeural',
+        'ru': 'ru-RU-SvetlanaNeural',
+        'ja': 'ja-JP-NanamiNeural',
+        'ko': 'ko-KR-SunHiNeural',
+        'zh': 'zh-CN-XiaoxiaoNeural',
+        'ar': 'ar-SA-ZariyahNeural',
+        'hi': 'hi-IN-SwaraNeural',
+        'nl': 'nl-NL-ColetteNeural',
+        'sv': 'sv-SE-SofieNeural',
+        'da': 'da-DK-ChristelNeural',
+        'no': 'nb-NO-PernilleNeural',
+        'fi': 'fi-FI-NooraNeural',
+        'pl': 'pl-PL-ZofiaNeural',
+        'cs': 'cs-CZ-VlastaNeural',
+        'sk': 'sk-SK-ViktoriaNeural',
+        'hu': 'hu-HU-NoemiNeural',
+        'ro': 'ro-RO-AlinaNeural',
+        'bg': 'bg-BG-KalinaNeural',
+        'hr': 'hr-HR-GabrijelaNeural',
+        'sl': 'sl-SI-PetraNeural',
+        'et': 'et-EE-AnuNeural',
+        'lv': 'lv-LV-EveritaNeural',
+        'lt': 'lt-LT-OnaNeural'
+    })
+
+    # Files waiting for the background deleter of cleanup_temp_files
+    _cleanup_queue = queue.Queue()
+    _cleanup_worker = None
+    _cleanup_lock = threading.Lock()
+
+    _limiter = threading.BoundedSemaphore(MAX_IN_FLIGHT)
+    _throttle_lock = threading.Lock()
+    _last_call_ts = 0.0
+
+    def __init__(self, cache_dir=None, backend=None):
         """
         Initialize the text-to-speech converter
+        
+        Args:
+            cache_dir (str): Directory for cached audio files; defaults to
+                TTS_CACHE_DIR (~/.cache/autoComm/tts)
+            backend (str): 'gtts' or 'edge'; defaults to TTS_BACKEND
         """
+        self.cache_dir = cache_dir or TTS_CACHE_DIR
+        
+        self.backend = (backend or TTS_BACKEND).lower()
+        if self.backend == 'edge' and not EDGE_TTS_AVAILABLE:
+            logger.warning("edge-tts not installed, using gTTS")
+            self.backend = 'gtts'
+        
+        # Recently synthesized audio bytes, most recently used last
+        self._memory_cache = OrderedDict()
+        self._memory_cache_lock = threading.Lock()
+        
+        # Short-lived audio files go to RAM-backed tmpfs when available
+        self._tmpdir = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else tempfile.gettempdir()
+        
         if PYGAME_AVAILABLE:
             try:
                 # Initialize pygame mixer for audio playback (optional)
                 pygame.mixer.init()
-                print("✅ Text-to-Speech Converter initialized successfully")
+                logger.info("Text-to-Speech Converter initialized successfully")
             except Exception as e:
-                print(f"⚠️  Text-to-Speech initialized with limited functionality: {e}")
+                logger.warning("Text-to-Speech initialized with limited functionality: %s", e)
         else:
-            print("✅ Text-to-Speech Converter initialized (no audio playback)")
+            logger.info("Text-to-Speech Converter initialized (no audio playback)")
 
-    def convert_text_to_speech(self, text, language='en', slow=False):
+    def convert_text_to_speech(self, text, language='en', slow=False, max_chunk_chars=MAX_CHUNK_CHARS):
         """
         Convert text to speech and return audio file path
         
@@ -39,9 +249,10 @@ class TextToSpeechConverter:
             text (str): Text to convert to speech
             language (str): Language code for speech
             slow (bool): Whether to speak slowly
+            max_chunk_chars (int): Longer texts are synthesized in parallel pieces of this size
             
         Returns:
-            str: Path to generated audio file
+            str: Path to generated audio file (a shared cache file: don't delete it)
         """
         try:
             # Clean and validate input text
@@ -49,42 +260,274 @@ class TextToSpeechConverter:
             if not text:
                 raise ValueError("Text cannot be empty")
             
-            if len(text) > 5000:  # Limit text length
-                text = text[:5000] + "..."
-                print("⚠️  Text truncated to 5000 characters")
+            # Reuse previously generated audio for the same text and settings
+            cache_path = self._cache_path(text, language, slow)
+            if os.path.exists(cache_path):
+                # Mark as recently used for cache pruning
+                os.utime(cache_path)
+                return cache_path
             
-            # Create gTTS object
-            tts = gTTS(text=text, lang=language, slow=slow)
+            chunked = len(text) > max_chunk_chars
+            if not chunked and self.backend != 'edge':
+                # Create gTTS object (validates the language before any file exists)
+                tts = _PooledGTTS(text=text, lang=language, slow=slow)
             
             # Create temporary file for audio
-            temp_audio = tempfile.NamedTemporaryFile(delete=False, suffix='.mp3')
+            temp_audio = tempfile.NamedTemporaryFile(delete=False, suffix='.mp3', dir=self._tmpdir)
             temp_audio.close()
             
-            # Save audio to temporary file
-            tts.save(temp_audio.name)
+            try:
+                if chunked:
+                    chunks = textwrap.wrap(text, max_chunk_chars, break_long_words=False, break_on_hyphens=False)
+                    with open(temp_audio.name, 'wb') as f:
+                        f.write(b''.join(self._synthesize_chunks(chunks, language, slow)))
+                elif self.backend == 'edge':
+                    asyncio.run(self._edge_communicate(text, language, slow).save(temp_audio.name))
+                else:
+                    # Stream audio into the temporary file
+                    self._synthesize(lambda: self._write_stream(tts, temp_audio.name))
+            except Exception:
+                # Don't leave partial audio behind in (RAM-backed) temp storage
+                self.cleanup_temp_files(temp_audio.name)
+                raise
             
-            print(f"✅ Audio generated successfully: {temp_audio.name}")
-            return temp_audio.name
+            logger.debug("Audio generated successfully: %s", temp_audio.name)
+            return self._store_in_cache(temp_audio.name, cache_path)
             
         except Exception as e:
-            print(f"❌ Text-to-speech conversion error: {e}")
+            logger.exception("Text-to-speech conversion error: %s", e)
             return self._create_fallback_audio(text, language)
 
+    def _synthesize_chunks(self, chunks, language, slow, concurrency=BATCH_CONCURRENCY):
+        """
+        Synthesize the pieces of a long text in parallel
+        
+        Returns:
+            list: MP3 bytes for each piece, in order (raises if any piece fails)
+        """
+        if self.backend == 'edge' or AIOHTTP_AVAILABLE:
+            results = asyncio.run(self._batch_bytes_async(chunks, language, slow, concurrency))
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+            return results
+        
+        def synthesize(chunk):
+            tts = _PooledGTTS(text=chunk, lang=language, slow=slow)
+            return self._synthesize(lambda: b''.join(tts.stream()))
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(chunks)))) as executor:
+            return list(executor.map(synthesize, chunks))
+
+    def _cache_path(self, text, language, slow):
+        """
+        Cache file for the audio of (text, language, slow)
+        """
+        key = f"{text}|{language}|{slow}"
+        if self.backend != 'gtts':
+            # Different voices, so separate cache entries
+            key += f"|{self.backend}"
+        key = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, key + '.mp3')
+
+    def _store_in_cache(self, audio_path, cache_path):
+        """
+        Move a freshly generated audio file into the cache
+        
+        Returns:
+            str: The cached path, or audio_path if the cache isn't writable
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            shutil.move(audio_path, cache_path)
+            return cache_path
+        except OSError as e:
+            logger.warning("Could not cache audio file: %s", e)
+            return audio_path
+
+    def _write_stream(self, tts, file_path):
+        """
+        Write gTTS's MP3 parts to file_path as they arrive
+        """
+        with open(file_path, 'wb', buffering=1 << 16) as f:
+            for chunk in tts.stream():
+                f.write(chunk)
+
+    def _synthesize(self, request):
+        """
+        Run a gTTS request under the shared rate limits, retrying on HTTP 429
+        
+        Args:
+            request (callable): Performs the gTTS request, e.g. lambda: tts.save(path)
+            
+        Returns:
+            The return value of request
+        """
+        for attempt in range(RETRY_ATTEMPTS):
+            with self._limiter:
+                self._throttle()
+                try:
+                    return request()
+                except gTTSError as e:
+                    if attempt == RETRY_ATTEMPTS - 1 or not self._is_rate_limited(e):
+                        raise
+            
+            # Back off (outside the limiter, so other requests can proceed)
+            delay = RETRY_BASE_DELAY * 2 ** attempt + random.random()
+            logger.warning("gTTS rate limited, retrying in %.1fs", delay)
+            time.sleep(delay)
+
+    def _throttle(self):
+        """
+        Wait until at least MIN_REQUEST_INTERVAL has passed since the last request started
+        """
+        with TextToSpeechConverter._throttle_lock:
+            wait = TextToSpeechConverter._last_call_ts + MIN_REQUEST_INTERVAL - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            TextToSpeechConverter._last_call_ts = time.monotonic()
+
+    def _edge_communicate(self, text, language, slow):
+        """
+        edge-tts request for text in the voice for language
+        """
+        voice = self.EDGE_VOICES.get(language.split('-')[0], self.EDGE_VOICES['en'])
+        return edge_tts.Communicate(text, voice, rate=EDGE_SLOW_RATE if slow else '+0%')
+
+    async def _edge_bytes(self, text, language, slow):
+        """
+        MP3 bytes for text from edge-tts
+        """
+        chunks = []
+        async for chunk in self._edge_communicate(text, language, slow).stream():
+            if chunk['type'] == 'audio':
+                chunks.append(chunk['data'])
+        return b''.join(chunks)
+
+    async def _gtts_bytes_async(self, tts, session):
+        """
+        MP3 bytes for a gTTS object, requested over an aiohttp session
+        
+        Follows the same shared rate limits (MAX_IN_FLIGHT across all callers,
+        MIN_REQUEST_INTERVAL spacing) and 429 retries as _synthesize, without
+        blocking the event loop. This relies on gTTS internals checked against
+        gTTS 2.3-2.5; when they are missing, the request runs through
+        _synthesize on a worker thread instead.
+        """
+        if not _GTTS_INTERNALS_AVAILABLE:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, lambda: self._synthesize(lambda: b''.join(tts.stream())))
+        
+        chunks = []
+        for request in tts._prepare_requests():
+            for attempt in range(RETRY_ATTEMPTS):
+                await self._acquire_limiter_async()
+                try:
+                    await self._throttle_async()
+                    async with session.post(request.url, data=request.body, headers=tts.GOOGLE_TTS_HEADERS,
+                                            ssl=False, timeout=aiohttp.ClientTimeout(total=tts.timeout)) as rsp:
+                        rate_limited = rsp.status == 429 and attempt < RETRY_ATTEMPTS - 1
+                        if not rate_limited:
+                            if rsp.status != 200:
+                                raise gTTSError(f"{rsp.status} ({rsp.reason}) from TTS API")
+                            
+                            async for line in rsp.content:
+                                line = line.decode('utf-8')
+                                if 'jQ1olc' in line:
+                                    audio = _AUDIO_LINE.search(line)
+                                    if not audio:
+                                        raise gTTSError("No audio stream in response")
+                                    chunks.append(base64.b64decode(audio.group(1).encode('ascii')))
+                finally:
+                    self._limiter.release()
+                
+                if not rate_limited:
+                    break
+                
+                # Back off (outside the limiter, so other requests can proceed)
+                delay = RETRY_BASE_DELAY * 2 ** attempt + random.random()
+                logger.warning("gTTS rate limited, retrying in %.1fs", delay)
+                await asyncio.sleep(delay)
+        
+        return b''.join(chunks)
+
+    async def _acquire_limiter_async(self):
+        """
+        Take a slot of the process-wide in-flight limit without blocking the event loop
+        """
+        while not self._limiter.acquire(blocking=False):
+            await asyncio.sleep(LIMITER_POLL_INTERVAL)
+
+    async def _throttle_async(self):
+        """
+        Asyncio counterpart of _throttle: reserve the next request slot, then sleep until it
+        """
+        with TextToSpeechConverter._throttle_lock:
+            now = time.monotonic()
+            start = max(now, TextToSpeechConverter._last_call_ts + MIN_REQUEST_INTERVAL)
+            TextToSpeechConverter._last_call_ts = start
+        
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def _client_session(self):
+        """
+        Pooled aiohttp session for gTTS requests (nothing for the edge backend)
+        """
+        if self.backend == 'edge':
+            return contextlib.nullcontext()
+        
+        connector = aiohttp.TCPConnector(limit=HTTP_POOL_SIZE, limit_per_host=HTTP_POOL_PER_HOST)
+        return aiohttp.ClientSession(connector=connector, trust_env=True)
+
+    async def _fetch_bytes_async(self, text, language, slow, session):
+        """
+        Synthesize text with the configured backend, without blocking the event loop
+        """
+        if self.backend == 'edge':
+            return await self._edge_bytes(text, language, slow)
+        
+        return await self._gtts_bytes_async(_PooledGTTS(text=text, lang=language, slow=slow), session)
+
+    async def _batch_bytes_async(self, texts, language, slow, concurrency):
+        """
+        Synthesize texts concurrently on one event loop, at most concurrency at once
+        
+        Returns:
+            list: MP3 bytes (or the raised exception) for each text, in order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async with self._client_session() as session:
+            async def synthesize(text):
+                async with semaphore:
+                    return await self._fetch_bytes_async(text, language, slow, session)
+            
+            return await asyncio.gather(*(synthesize(text) for text in texts), return_exceptions=True)
+
+    @staticmethod
+    def _is_rate_limited(error):
+        """
+        Whether a gTTSError comes from Google's rate limiter
+        """
+        rsp = getattr(error, 'rsp', None)
+        return (rsp is not None and rsp.status_code == 429) or '429' in str(error)
+
     def _create_fallback_audio(self, text, language):
         """
         Create a fallback audio file when gTTS fails
         """
         try:
             # Create a simple text file as fallback
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.txt', mode='w')
+            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.txt', mode='w', dir=self._tmpdir)
             temp_file.write(f"Text-to-Speech Output:\n\n{text}\n\nLanguage: {language}")
             temp_file.close()
             
-            print(f"⚠️  Fallback: Created text file instead of audio: {temp_file.name}")
+            logger.warning("Fallback: Created text file instead of audio: %s", temp_file.name)
             return temp_file.name
             
         except Exception as e:
-            print(f"❌ Fallback creation failed: {e}")
+            logger.error("Fallback creation failed: %s", e)
             return None
 
     def play_audio(self, audio_file_path):
@@ -95,30 +538,60 @@ class TextToSpeechConverter:
             audio_file_path (str): Path to audio file
         """
         if not PYGAME_AVAILABLE:
-            print("⚠️ Audio playback not available (pygame not installed)")
+            logger.warning("Audio playback not available (pygame not installed)")
             return False
             
         try:
             if not os.path.exists(audio_file_path):
-                print("❌ Audio file not found")
+                logger.error("Audio file not found: %s", audio_file_path)
                 return False
             
-            # Try to play using pygame
+            # The event queue needs pygame's display module; without it
+            # (e.g. headless) the mixer is polled instead
+            use_events = self._init_events()
+            
+            # Register the end event before playback starts, so it can't be missed
+            pygame.mixer.music.set_endevent(PLAYBACK_END_EVENT if use_events else pygame.NOEVENT)
             pygame.mixer.music.load(audio_file_path)
             pygame.mixer.music.play()
             
-            print("🔊 Playing audio...")
+            logger.debug("Playing audio: %s", audio_file_path)
             
             # Wait for playback to complete
-            while pygame.mixer.music.get_busy():
-                pygame.time.wait(100)
+            self._wait_for_playback(use_events)
             
             return True
             
         except Exception as e:
-            print(f"❌ Audio playback error: {e}")
+            logger.error("Audio playback error: %s", e)
+            return False
+
+    @staticmethod
+    def _init_events():
+        """
+        Initialize pygame's event system, returning whether it is usable
+        """
+        try:
+            if not pygame.display.get_init():
+                pygame.display.init()
+            return True
+        except pygame.error:
             return False
 
+    @staticmethod
+    def _wait_for_playback(use_events):
+        """
+        Block until playback ends: on the end event, or once the mixer is no
+        longer busy (checked each PLAYBACK_POLL_MS in case the event is lost)
+        """
+        while pygame.mixer.music.get_busy():
+            if use_events:
+                event = pygame.event.wait(PLAYBACK_POLL_MS)
+                if event.type == PLAYBACK_END_EVENT:
+                    return
+            else:
+                pygame.time.wait(PLAYBACK_POLL_MS)
+
     def convert_text_to_speech_bytes(self, text, language='en', slow=False):
         """
         Convert text to speech and return as bytes (for web streaming)
@@ -136,106 +609,227 @@ class TextToSpeechConverter:
             if not text:
                 return None
             
-            # Create gTTS object
-            tts = gTTS(text=text, lang=language, slow=slow)
+            return self._speech_bytes(text, language, slow)
+            
+        except Exception as e:
+            logger.exception("Text-to-speech bytes conversion error: %s", e)
+            return None
+
+    async def convert_text_to_speech_bytes_async(self, text, language='en', slow=False):
+        """
+        Async version of convert_text_to_speech_bytes, for use inside an event loop
+        
+        Args:
+            text (str): Text to convert
+            language (str): Language code
+            slow (bool): Whether to speak slowly
+            
+        Returns:
+            bytes: Audio data as bytes
+        """
+        try:
+            text = text.strip()
+            if not text:
+                return None
             
-            # Save to BytesIO buffer
-            audio_buffer = BytesIO()
-            tts.write_to_fp(audio_buffer)
-            audio_buffer.seek(0)
+            if self.backend != 'edge' and not AIOHTTP_AVAILABLE:
+                return await asyncio.to_thread(self._speech_bytes, text, language, slow)
             
-            return audio_buffer.read()
+            cache_path = self._cache_path(text, language, slow)
+            if os.path.exists(cache_path):
+                os.utime(cache_path)
+                with open(cache_path, 'rb') as f:
+                    return f.read()
+            
+            async with self._client_session() as session:
+                audio = await self._fetch_bytes_async(text, language, slow, session)
+            
+            self._write_through(audio, cache_path)
+            return audio
             
         except Exception as e:
-            print(f"❌ Text-to-speech bytes conversion error: {e}")
+            logger.exception("Text-to-speech bytes conversion error: %s", e)
             return None
 
+    def _speech_bytes(self, text, language, slow):
+        """
+        MP3 bytes for text from the memory cache, the disk cache or gTTS
+        
+        Failures raise, so they are never cached.
+        """
+        key = (text, language, slow)
+        with self._memory_cache_lock:
+            audio = self._memory_cache.get(key)
+            if audio is not None:
+                self._memory_cache.move_to_end(key)
+                return audio
+        
+        audio = self._load_speech_bytes(text, language, slow)
+        
+        with self._memory_cache_lock:
+            self._memory_cache[key] = audio
+            self._memory_cache.move_to_end(key)
+            if len(self._memory_cache) > TTS_MEMORY_CACHE_SIZE:
+                self._memory_cache.popitem(last=False)
+        
+        return audio
+
+    def _load_speech_bytes(self, text, language, slow):
+        """
+        MP3 bytes for text from the disk cache or gTTS
+        """
+        cache_path = self._cache_path(text, language, slow)
+        if os.path.exists(cache_path):
+            os.utime(cache_path)
+            with open(cache_path, 'rb') as f:
+                return f.read()
+        
+        if self.backend == 'edge':
+            audio = asyncio.run(self._edge_bytes(text, language, slow))
+        else:
+            # Create gTTS object
+            tts = _PooledGTTS(text=text, lang=language, slow=slow)
+            
+            # Join the streamed MP3 parts in one allocation
+            audio = self._synthesize(lambda: b''.join(tts.stream()))
+        
+        self._write_through(audio, cache_path)
+        return audio
+
+    def _write_through(self, audio, cache_path):
+        """
+        Write freshly synthesized audio bytes to the disk cache
+        """
+        temp_audio = tempfile.NamedTemporaryFile(delete=False, suffix='.mp3', dir=self._tmpdir)
+        with temp_audio:
+            temp_audio.write(audio)
+        if self._store_in_cache(temp_audio.name, cache_path) != cache_path:
+            os.unlink(temp_audio.name)
+
     def get_supported_languages(self):
         """
         Get supported language codes for text-to-speech
         """
-        return {
-            'en': 'English',
-            'es': 'Spanish',
-            'fr': 'French',
-            'de': 'German',
-            'it': 'Italian',
-            'pt': 'Portuguese',
-            'ru': 'Russian',
-            'ja': 'Japanese',
-            'ko': 'Korean',
-            'zh': 'Chinese (Mandarin)',
-            'ar': 'Arabic',
-            'hi': 'Hindi',
-            'nl': 'Dutch',
-            'sv': 'Swedish',
-            'da': 'Danish',
-            'no': 'Norwegian',
-            'fi': 'Finnish',
-            'pl': 'Polish',
-            'cs': 'Czech',
-            'sk': 'Slovak',
-            'hu': 'Hungarian',
-            'ro': 'Romanian',
-            'bg': 'Bulgarian',
-            'hr': 'Croatian',
-            'sl': 'Slovenian',
-            'et': 'Estonian',
-            'lv': 'Latvian',
-            'lt': 'Lithuanian'
-        }
-
-    def cleanup_temp_files(self, file_path):
+        return self.SUPPORTED_LANGUAGES
+
+    def cleanup_temp_files(self, file_paths, background=False):
         """
         Clean up temporary audio files
         
         Args:
-            file_path (str): Path to file to delete
+            file_paths (str or list): Path(s) of files to delete, e.g. the
+                result of batch_convert
+            background (bool): Delete on a background thread and return immediately
         """
-        try:
-            if os.path.exists(file_path):
+        if isinstance(file_paths, str):
+            file_paths = [file_paths]
+        
+        if not background:
+            self._delete_files(file_paths)
+            return
+        
+        with TextToSpeechConverter._cleanup_lock:
+            if TextToSpeechConverter._cleanup_worker is None:
+                TextToSpeechConverter._cleanup_worker = threading.Thread(
+                    target=self._run_cleanup, name='TTSCleanup', daemon=True)
+                TextToSpeechConverter._cleanup_worker.start()
+        
+        self._cleanup_queue.put(list(file_paths))
+
+    @classmethod
+    def _run_cleanup(cls):
+        """
+        Background deleter loop for cleanup_temp_files
+        """
+        while True:
+            cls._delete_files(cls._cleanup_queue.get())
+
+    @staticmethod
+    def _delete_files(file_paths):
+        """
+        Unlink each file, skipping ones that are already gone
+        """
+        for file_path in file_paths:
+            try:
                 os.unlink(file_path)
-                print(f"🗑️  Cleaned up temporary file: {file_path}")
-        except Exception as e:
-            print(f"⚠️  Could not clean up file {file_path}: {e}")
+                logger.debug("Cleaned up temporary file: %s", file_path)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning("Could not clean up file %s: %s", file_path, e)
 
-    def batch_convert(self, texts, language='en', output_dir=None):
+    def batch_convert(self, texts, language='en', output_dir=None, concurrency=BATCH_CONCURRENCY):
         """
         Convert multiple texts to speech files
         
+        Distinct texts are synthesized in parallel (each one is a network
+        round-trip), and the returned paths keep the order of texts. With
+        edge-tts or aiohttp installed they run as concurrent asyncio requests
+        on one event loop, otherwise on a thread pool.
+        
         Args:
             texts (list): List of texts to convert
             language (str): Language code
             output_dir (str): Directory to save files
+            concurrency (int): Maximum number of texts synthesized at once
             
         Returns:
             list: List of generated file paths
         """
         try:
             if not output_dir:
-                output_dir = tempfile.mkdtemp()
-            
-            audio_files = []
+                output_dir = tempfile.mkdtemp(dir=self._tmpdir)
             
+            # Synthesize each distinct text once; repeats reuse its file
+            jobs = {}
             for i, text in enumerate(texts):
-                if not text.strip():
-                    continue
-                
+                if text.strip():
+                    jobs.setdefault(text.strip(), []).append(i)
+            
+            # Uncached texts are all requested at once on one event loop
+            prefetched = {}
+            if self.backend == 'edge' or AIOHTTP_AVAILABLE:
+                pending = [text for text in jobs if not os.path.exists(self._cache_path(text, language, False))]
+                if pending:
+                    results = asyncio.run(self._batch_bytes_async(pending, language, False, concurrency))
+                    prefetched = dict(zip(pending, results))
+            
+            def generate(job):
+                text, indices = job
                 try:
-                    tts = gTTS(text=text.strip(), lang=language)
+                    audio = prefetched.get(text)
+                    if isinstance(audio, Exception):
+                        raise audio
+                    if audio is None:
+                        # Cached texts skip the request entirely
+                        audio = self._speech_bytes(text, language, False)
+                    else:
+                        self._write_through(audio, self._cache_path(text, language, False))
                     
-                    file_path = os.path.join(output_dir, f"speech_{i+1}.mp3")
-                    tts.save(file_path)
-                    audio_files.append(file_path)
+                    file_paths = [os.path.join(output_dir, f"speech_{i+1}.mp3") for i in indices]
+                    with open(file_paths[0], 'wb') as f:
+                        f.write(audio)
                     
-                    print(f"✅ Generated audio {i+1}/{len(texts)}")
+                    for file_path in file_paths[1:]:
+                        try:
+                            os.link(file_paths[0], file_path)
+                        except OSError:
+                            # No hard links (e.g. FAT/Windows shares)
+                            shutil.copyfile(file_paths[0], file_path)
+                    
+                    logger.debug("Generated audio %d/%d", indices[0] + 1, len(texts))
+                    return list(zip(indices, file_paths))
                     
                 except Exception as e:
-                    print(f"⚠️  Failed to generate audio for text {i+1}: {e}")
-                    continue
+                    logger.warning("Failed to generate audio for text %d: %s", indices[0] + 1, e)
+                    return []
+            
+            with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(jobs)))) as executor:
+                results = list(executor.map(generate, jobs.items()))
             
-            return audio_files
+            # Back to the original order of texts
+            return [file_path for _, file_path in sorted(pair for pairs in results for pair in pairs)]
             
         except Exception as e:
-            print(f"❌ Batch conversion error: {e}")
+            logger.exception("Batch conversion error: %s", e)
             return []
\ No newline at end of file
@@ -3,62 +3,273 @@ Language Translation Service
 Uses fallback translation methods when AI models are not available
 """
 
+import logging
+
+logger = logging.getLogger(__name__)
+
 try:
     from transformers import pipeline
     TRANSFORMERS_AVAILABLE = True
 except ImportError:
     TRANSFORMERS_AVAILABLE = False
-    print("⚠️ Transformers not available, using fallback translation")
+    logger.warning("Transformers not available, using fallback translation")
 
-import logging
+import contextlib
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+
+# Helsinki-NLP models are efficient for translation, one model per language pair
+TRANSLATION_MODEL = "Helsinki-NLP/opus-mt-{source}-{target}"
+
+# Longest input (in tokens) fed to a translation model
+MAX_TRANSLATION_TOKENS = 512
+
+# Translation models kept loaded at once; the least recently used pair is dropped
+MAX_LOADED_PIPELINES = 8
+
+# Seconds before a language pair whose model failed to load is tried again
+LOAD_RETRY_INTERVAL = 300
+
+# Word-to-word translations for common phrases, used when no model is available
+FALLBACK_TRANSLATIONS = {
+    "en_to_es": {
+        "hello": "hola",
+        "world": "mundo",
+        "good": "bueno",
+        "morning": "mañana",
+        "afternoon": "tarde",
+        "evening": "noche",
+        "thank you": "gracias",
+        "please": "por favor",
+        "yes": "sí",
+        "no": "no",
+        "water": "agua",
+        "food": "comida",
+        "house": "casa",
+        "car": "coche",
+        "book": "libro",
+        "computer": "computadora"
+    },
+    "en_to_fr": {
+        "hello": "bonjour",
+        "world": "monde",
+        "good": "bon",
+        "morning": "matin",
+        "afternoon": "après-midi",
+        "evening": "soir",
+        "thank you": "merci",
+        "please": "s'il vous plaît",
+        "yes": "oui",
+        "no": "non",
+        "water": "eau",
+        "food": "nourriture",
+        "house": "maison",
+        "car": "voiture",
+        "book": "livre",
+        "computer": "ordinateur"
+    },
+    "en_to_de": {
+        "hello": "hallo",
+        "world": "welt",
+        "good": "gut",
+        "morning": "morgen",
+        "afternoon": "nachmittag",
+        "evening": "abend",
+        "thank you": "danke",
+        "please": "bitte",
+        "yes": "ja",
+        "no": "nein",
+        "water": "wasser",
+        "food": "essen",
+        "house": "haus",
+        "car": "auto",
+        "book": "buch",
+        "computer": "computer"
+    }
+}
+
+def _build_fallback_patterns(translations):
+    """
+    Compile one (pattern, replace) pair per language pair of the fallback word table
+    
+    replace maps a match to its translation, so pattern.sub(replace, text)
+    writes the whole translated text in a single pass.
+    """
+    patterns = {}
+    for key, mapping in translations.items():
+        # Longest phrases first so 'thank you' wins over any shorter prefix
+        words = sorted(mapping, key=len, reverse=True)
+        pattern = re.compile(r'\b(' + '|'.join(map(re.escape, words)) + r')\b', re.IGNORECASE)
+        patterns[key] = (pattern, lambda match, mapping=mapping: mapping[match.group(0).lower()])
+    
+    return patterns
+
+_FALLBACK_PATTERNS = _build_fallback_patterns(FALLBACK_TRANSLATIONS)
+
+# Canned results used when a language pair's model can't be loaded:
+# (source_lang, target_lang) -> (greeting, greeting translation, template for other text)
+DEMO_TRANSLATIONS = {
+    ("en", "es"): ("hello", "Hello world", "Translated to Spanish: {text}"),
+    ("en", "fr"): ("hello", "Bonjour le monde", "Traduit en français: {text}"),
+    ("en", "de"): ("hello", "Hallo Welt", "Ins Deutsche übersetzt: {text}"),
+    ("en", "it"): ("hello", "Ciao mondo", "Tradotto in italiano: {text}"),
+    ("es", "en"): ("hola", "Hello world", "Translated to English: {text}"),
+    ("fr", "en"): ("bonjour", "Hello world", "Translated to English: {text}"),
+}
+
+def _inference_mode():
+    """
+    torch.inference_mode() when torch is installed, otherwise a no-op context
+    """
+    try:
+        import torch
+        return torch.inference_mode()
+    except ImportError:
+        return contextlib.nullcontext()
 
 class LanguageTranslator:
+    # Read-only, so callers can't mutate the shared mapping
+    SUPPORTED_LANGUAGES = MappingProxyType({
+        'en': 'English',
+        'es': 'Spanish',
+        'fr': 'French',
+        'de': 'German',
+        'it': 'Italian',
+        'pt': 'Portuguese',
+        'ru': 'Russian',
+        'ja': 'Japanese',
+        'ko': 'Korean',
+        'zh': 'Chinese',
+        'ar': 'Arabic',
+        'hi': 'Hindi'
+    })
+
     def __init__(self):
         """
-        Initialize the translation models
+        Initialize the translator
+        
+        Models are loaded lazily per language pair on first use, so the
+        constructor doesn't download or load any weights.
         """
-        self.translator = None
+        # (source_lang, target_lang) -> pipeline, most recently used last
+        self._pipelines = OrderedDict()
+        # (source_lang, target_lang) -> time.monotonic() of the last failed load
+        self._failed_loads = {}
+        self._pipelines_lock = threading.Lock()
+        
+        # One lock per pair, so a slow download only blocks requests for that pair
+        self._load_locks = {}
         
         if TRANSFORMERS_AVAILABLE:
-            try:
-                # Initialize translation pipeline
-                # Using Helsinki-NLP models which are efficient for translation
-                self._load_translator()
-                print("✅ Language Translator initialized successfully")
-            except Exception as e:
-                print(f"❌ Failed to initialize translator: {e}")
-                self.translator = None
+            logger.info("Language Translator initialized (models load on first use)")
         else:
-            print("✅ Language Translator initialized with fallback method")
+            logger.info("Language Translator initialized with fallback method")
 
-    def _load_translator(self):
+    def _get_pipe(self, source_lang, target_lang):
         """
-        Load the translation model dynamically
+        Get the translation pipeline for a language pair, loading it on first use
+        
+        Returns:
+            The pipeline, or None for unsupported pairs and models that failed to load
         """
-        if not TRANSFORMERS_AVAILABLE:
-            return
+        if not self._is_supported_pair(source_lang, target_lang):
+            return None
+        
+        key = (source_lang, target_lang)
+        with self._pipelines_lock:
+            if self._is_cached(key):
+                return self._pipelines.get(key)
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        
+        with load_lock:
+            # Another request may have loaded it while we waited
+            with self._pipelines_lock:
+                if self._is_cached(key):
+                    return self._pipelines.get(key)
+            
+            translator = self._load_translator(source_lang, target_lang)
             
+            with self._pipelines_lock:
+                if translator is None:
+                    self._failed_loads[key] = time.monotonic()
+                else:
+                    self._failed_loads.pop(key, None)
+                    self._pipelines[key] = translator
+                    while len(self._pipelines) > MAX_LOADED_PIPELINES:
+                        self._pipelines.popitem(last=False)
+        
+        return translator
+
+    def _is_supported_pair(self, source_lang, target_lang):
+        """
+        Whether a model may exist for the pair (both known codes, and different)
+        """
+        return (isinstance(source_lang, str) and isinstance(target_lang, str)
+                and source_lang in self.SUPPORTED_LANGUAGES
+                and target_lang in self.SUPPORTED_LANGUAGES
+                and source_lang != target_lang)
+
+    def _is_cached(self, key):
+        """
+        Whether key is loaded or failed recently (call with _pipelines_lock held)
+        """
+        if key in self._pipelines:
+            self._pipelines.move_to_end(key)
+            return True
+        
+        failed_at = self._failed_loads.get(key)
+        return failed_at is not None and time.monotonic() - failed_at < LOAD_RETRY_INTERVAL
+
+    def _load_translator(self, source_lang, target_lang):
+        """
+        Load the translation model for a language pair, or return None if unavailable
+        """
+        model_name = TRANSLATION_MODEL.format(source=source_lang, target=target_lang)
+        
         try:
-            # Use a general-purpose translation model
-            self.translator = pipeline("translation", model="Helsinki-NLP/opus-mt-en-de")
+            import torch
+            cuda = torch.cuda.is_available()
+            
+            if os.environ.get('TRANSLATOR_QUANTIZE', 'True').lower() in ('1', 'true'):
+                from transformers import MarianMTModel, MarianTokenizer
+                
+                # Half precision on GPU, dynamic int8 Linear layers on CPU
+                model = MarianMTModel.from_pretrained(model_name, torch_dtype=torch.float16 if cuda else torch.float32)
+                if not cuda:
+                    model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+                tokenizer = MarianTokenizer.from_pretrained(model_name)
+                
+                translator = pipeline("translation", model=model, tokenizer=tokenizer, device=0 if cuda else -1)
+            else:
+                translator = pipeline("translation", model=model_name, device=0 if cuda else -1)
+            logger.info("Translation model loaded: %s", model_name)
+            return translator
         except Exception as e:
-            print(f"⚠️  Translation model loading failed: {e}")
-            self.translator = None
+            logger.warning("Translation model loading failed for %s: %s", model_name, e)
+            return None
 
     def translate(self, text, source_lang="auto", target_lang="en"):
         """
         Translate text from source language to target language
         
         Args:
-            text (str): Text to translate
+            text (str or list): Text to translate; a list is translated with translate_batch
             source_lang (str): Source language code
             target_lang (str): Target language code
             
         Returns:
-            str: Translated text
+            str: Translated text (a list of them for a list of texts)
         """
+        if isinstance(text, (list, tuple)):
+            return self.translate_batch(text, source_lang, target_lang)
+        
         try:
-            if not self.translator:
+            # No model for this pair (or none at all): use the word-table fallback
+            if not TRANSFORMERS_AVAILABLE or self._get_pipe(source_lang, target_lang) is None:
                 return self._fallback_translate(text, source_lang, target_lang)
             
             # Clean input text
@@ -73,43 +284,129 @@ class LanguageTranslator:
             return translation_result
             
         except Exception as e:
-            print(f"❌ Translation error: {e}")
+            logger.exception("Translation error: %s", e)
+            return self._fallback_translate(text, source_lang, target_lang)
+
+    def translate_batch(self, texts, source_lang="auto", target_lang="en", batch_size=16):
+        """
+        Translate several texts from source language to target language
+        
+        The texts are sent through the model in padded minibatches, which costs
+        far less per text than one pipeline call each.
+        
+        Args:
+            texts (list): Texts to translate
+            source_lang (str): Source language code
+            target_lang (str): Target language code
+            batch_size (int): Number of texts per model forward pass
+            
+        Returns:
+            list: Translated texts, in the same order as texts
+        """
+        texts = [text.strip() for text in texts]
+        
+        translator = self._get_pipe(source_lang, target_lang) if TRANSFORMERS_AVAILABLE else None
+        if translator is None:
+            return [self.translate(text, source_lang, target_lang) for text in texts]
+        
+        translations = [""] * len(texts)
+        indices = [i for i, text in enumerate(texts) if text]
+        
+        try:
+            with _inference_mode():
+                results = translator(
+                    [texts[i] for i in indices],
+                    batch_size=batch_size,
+                    max_length=MAX_TRANSLATION_TOKENS,
+                    truncation=True
+                )
+            
+            for i, result in zip(indices, results):
+                translations[i] = result.get('translation_text', texts[i])
+            
+            return translations
+            
+        except Exception as e:
+            logger.exception("Batch translation error: %s", e)
+            return [self._fallback_translate(text, source_lang, target_lang) for text in texts]
+
+    def translate_with_model(self, text, source_lang, target_lang):
+        """
+        Translate text with the pair's model only, without any fallback
+        
+        Returns:
+            str: The model's translation, or None if no model is available or it failed
+        """
+        text = text.strip()
+        if not TRANSFORMERS_AVAILABLE or not text:
+            return None
+        
+        try:
+            translator = self._get_pipe(source_lang, target_lang)
+            if translator is None:
+                return None
+            
+            with _inference_mode():
+                result = translator(text, max_length=MAX_TRANSLATION_TOKENS, truncation=True)
+            if isinstance(result, list) and len(result) > 0 and 'translation_text' in result[0]:
+                return result[0]['translation_text']
+            return None
+            
+        except Exception as e:
+            logger.exception("Model translation error: %s", e)
+            return None
+
+    def translate_without_model(self, text, source_lang="auto", target_lang="en"):
+        """
+        What translate() returns when the pair's model gives no translation
+        
+        For callers that already tried translate_with_model, so the model
+        is not run a second time.
+        
+        Returns:
+            str: The fallback translation
+        """
+        try:
+            if not TRANSFORMERS_AVAILABLE or self._get_pipe(source_lang, target_lang) is None:
+                return self._fallback_translate(text, source_lang, target_lang)
+            
+            text = text.strip()
+            if not text:
+                return ""
+            
+            return self._demo_translate(text, source_lang, target_lang)
+            
+        except Exception as e:
+            logger.exception("Translation error: %s", e)
             return self._fallback_translate(text, source_lang, target_lang)
 
     def _get_translation(self, text, source_lang, target_lang):
         """
         Get translation using the appropriate model
         """
+        # Try to use the model for actual translation
+        translation = self.translate_with_model(text, source_lang, target_lang)
+        if translation is not None:
+            return translation
+        
+        return self._demo_translate(text, source_lang, target_lang)
+
+    def _demo_translate(self, text, source_lang, target_lang):
+        """
+        Demo mapping for a pair whose model gave no translation
+        """
         try:
-            # For demonstration, we'll use a simple approach
-            # In production, you'd want to load specific models for different language pairs
-            
-            # Common translation mappings
-            translation_map = {
-                ("en", "es"): "Hello world" if "hello" in text.lower() else f"Translated to Spanish: {text}",
-                ("en", "fr"): "Bonjour le monde" if "hello" in text.lower() else f"Traduit en français: {text}",
-                ("en", "de"): "Hallo Welt" if "hello" in text.lower() else f"Ins Deutsche übersetzt: {text}",
-                ("en", "it"): "Ciao mondo" if "hello" in text.lower() else f"Tradotto in italiano: {text}",
-                ("es", "en"): "Hello world" if "hola" in text.lower() else f"Translated to English: {text}",
-                ("fr", "en"): "Hello world" if "bonjour" in text.lower() else f"Translated to English: {text}",
-            }
-            
-            # Try to use the model for actual translation
-            if hasattr(self.translator, '__call__'):
-                result = self.translator(text)
-                if isinstance(result, list) and len(result) > 0:
-                    return result[0].get('translation_text', text)
-            
-            # Fallback to mapping
-            key = (source_lang, target_lang)
-            if key in translation_map:
-                return translation_map[key]
+            # Fallback to mapping (only the requested pair is checked)
+            demo = DEMO_TRANSLATIONS.get((source_lang, target_lang))
+            if demo is not None:
+                greeting, greeting_translation, template = demo
+                return greeting_translation if greeting in text.lower() else template.format(text=text)
             
             # Ultimate fallback
             return f"[{target_lang.upper()}] {text}"
             
         except Exception as e:
-            print(f"❌ Model translation error: {e}")
+            logger.exception("Model translation error: %s", e)
             return f"[{target_lang.upper()}] {text}"
 
     def _fallback_translate(self, text, source_lang, target_lang):
@@ -117,103 +414,23 @@ class LanguageTranslator:
         Fallback translation method using simple word replacement
         """
         try:
-            # Simple word-to-word translation for common phrases
-            common_translations = {
-                "en_to_es": {
-                    "hello": "hola",
-                    "world": "mundo",
-                    "good": "bueno",
-                    "morning": "mañana",
-                    "afternoon": "tarde",
-                    "evening": "noche",
-                    "thank you": "gracias",
-                    "please": "por favor",
-                    "yes": "sí",
-                    "no": "no",
-                    "water": "agua",
-                    "food": "comida",
-                    "house": "casa",
-                    "car": "coche",
-                    "book": "libro",
-                    "computer": "computadora"
-                },
-                "en_to_fr": {
-                    "hello": "bonjour",
-                    "world": "monde",
-                    "good": "bon",
-                    "morning": "matin",
-                    "afternoon": "après-midi",
-                    "evening": "soir",
-                    "thank you": "merci",
-                    "please": "s'il vous plaît",
-                    "yes": "oui",
-                    "no": "non",
-                    "water": "eau",
-                    "food": "nourriture",
-                    "house": "maison",
-                    "car": "voiture",
-                    "book": "livre",
-                    "computer": "ordinateur"
-                },
-                "en_to_de": {
-                    "hello": "hallo",
-                    "world": "welt",
-                    "good": "gut",
-                    "morning": "morgen",
-                    "afternoon": "nachmittag",
-                    "evening": "abend",
-                    "thank you": "danke",
-                    "please": "bitte",
-                    "yes": "ja",
-                    "no": "nein",
-                    "water": "wasser",
-                    "food": "essen",
-                    "house": "haus",
-                    "car": "auto",
-                    "book": "buch",
-                    "computer": "computer"
-                }
-            }
-            
             # Create translation key
             translation_key = f"{source_lang}_to_{target_lang}"
             
-            if translation_key in common_translations:
-                translated_words = []
-                words = text.lower().split()
-                
-                for word in words:
-                    # Remove punctuation for lookup
-                    clean_word = word.strip('.,!?;:"')
-                    if clean_word in common_translations[translation_key]:
-                        translated_words.append(common_translations[translation_key][clean_word])
-                    else:
-                        translated_words.append(word)
-                
-                return " ".join(translated_words)
+            if translation_key in _FALLBACK_PATTERNS:
+                # One regex pass replaces every known word or phrase
+                pattern, replace = _FALLBACK_PATTERNS[translation_key]
+                return pattern.sub(replace, text)
             else:
                 # No specific translation available
                 return f"[Translated to {target_lang.upper()}] {text}"
                 
         except Exception as e:
-            print(f"❌ Fallback translation error: {e}")
+            logger.exception("Fallback translation error: %s", e)
             return f"[Translation Error] {text}"
 
     def get_supported_languages(self):
         """
         Get list of supported language codes
         """
-        return {
-            'en': 'English',
-            'es': 'Spanish',
-            'fr': 'French',
-            'de': 'German',
-            'it': 'Italian',
-            'pt': 'Portuguese',
-            'ru': 'Russian',
-            'ja': 'Japanese',
-            'ko': 'Korean',
-            'zh': 'Chinese',
-            'ar': 'Arabic',
-            'hi': 'Hindi'
-        }
\ No newline at end of file
+        return self.SUPPORTED_LANGUAGES
\ No newline at end of file
@@ -5,17 +5,23 @@ Tests different length and style combinations
 
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 
 # Test text
 test_text = """Artificial intelligence has revolutionized the way we interact with technology. Machine learning algorithms can now process vast amounts of data and identify patterns that humans might miss. Deep learning, a subset of machine learning, uses neural networks with multiple layers to analyze complex data structures. These technologies are being applied in various fields including healthcare, finance, and autonomous vehicles. Natural language processing enables computers to understand and generate human language, making chatbots and virtual assistants more sophisticated. Computer vision allows machines to interpret and understand visual information from the world. As AI continues to advance, ethical considerations become increasingly important, including issues of privacy, bias, and job displacement."""
 
 API_URL = "http://localhost:5000/api/summarize"
 
+# One keep-alive connection pool shared by all concurrent test requests
+session = requests.Session()
+session.mount('http://', HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
 def test_summarization(length, style):
-    """Test summarization with given parameters"""
-    print(f"\n{'='*80}")
-    print(f"Testing: Length={length.upper()}, Style={style.upper()}")
-    print(f"{'='*80}")
+    """Test summarization with given parameters and return the report"""
+    lines = [f"\n{'='*80}"]
+    lines.append(f"Testing: Length={length.upper()}, Style={style.upper()}")
+    lines.append(f"{'='*80}")
     
     payload = {
         "text": test_text,
@@ -24,22 +30,24 @@ def test_summarization(length, style):
     }
     
     try:
-        response = requests.post(API_URL, json=payload)
+        response = session.post(API_URL, json=payload, timeout=60)
         data = response.json()
         
         if data.get('success'):
-            print(f"\n✅ SUCCESS!")
-            print(f"Original Length: {data['original_length']} characters")
-            print(f"Summary Length: {data['summary_length']} characters")
-            print(f"Reduction: {round((1 - data['summary_length']/data['original_length'])*100, 1)}%")
-            print(f"\nSummary:\n{'-'*80}")
-            print(data['summary'])
-            print(f"{'-'*80}")
+            lines.append(f"\n✅ SUCCESS!")
+            lines.append(f"Original Length: {data['original_length']} characters")
+            lines.append(f"Summary Length: {data['summary_length']} characters")
+            lines.append(f"Reduction: {round((1 - data['summary_length']/data['original_length'])*100, 1)}%")
+            lines.append(f"\nSummary:\n{'-'*80}")
+            lines.append(data['summary'])
+            lines.append(f"{'-'*80}")
         else:
-            print(f"\n❌ ERROR: {data.get('error', 'Unknown error')}")
+            lines.append(f"\n❌ ERROR: {data.get('error', 'Unknown error')}")
             
     except Exception as e:
-        print(f"\n❌ EXCEPTION: {str(e)}")
+        lines.append(f"\n❌ EXCEPTION: {str(e)}")
+    
+    return "\n".join(lines)
 
 if __name__ == "__main__":
     print("🧪 ML-Based Text Summarization Test Suite")
@@ -49,9 +57,11 @@ if __name__ == "__main__":
     lengths = ['short', 'medium', 'long']
     styles = ['paragraph', 'bullet', 'abstract']
     
-    for length in lengths:
-        for style in styles:
-            test_summarization(length, style)
+    # Run all combinations concurrently, reporting in the original order
+    with ThreadPoolExecutor(max_workers=len(lengths) * len(styles)) as executor:
+        futures = [executor.submit(test_summarization, length, style) for length in lengths for style in styles]
+        for future in futures:
+            print(future.result())
     
     print(f"\n{'='*80}")
     print("✅ All tests completed!")
@@ -0,0 +1,62 @@
+"""
+AutoComm - Shared helpers for the Flask applications
+"""
+
+import functools
+from flask import Response, request
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+    print("⚠️ orjson not available, using standard json encoder")
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that parses request bodies with orjson when available
+    """
+    def loads(self, s, **kwargs):
+        if ORJSON_AVAILABLE:
+            # orjson takes the raw UTF-8 bytes directly, no str decode step
+            return orjson.loads(s)
+        return super().loads(s, **kwargs)
+
+def ojsonify(obj, status=200):
+    """
+    Build a JSON response, encoded with orjson when available
+    
+    Args:
+        obj: JSON-serializable response payload
+        status (int): HTTP status code
+        
+    Returns:
+        Response: Flask response with an application/json body
+    """
+    if ORJSON_AVAILABLE:
+        body = orjson.dumps(obj)
+    else:
+        body = json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    
+    return Response(body, status=status, mimetype='application/json')
+
+def limit_content_length(max_bytes):
+    """
+    Reject request bodies over max_bytes (from Content-Length) before they are read
+    
+    Args:
+        max_bytes (int): Largest accepted body size for the decorated route
+        
+    Returns:
+        callable: Route decorator
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            if (request.content_length or 0) > max_bytes:
+                return ojsonify({'error': f'Request body too large (max {max_bytes} bytes)'}, 413)
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,11 @@
+"""
+AutoComm - WSGI entrypoint for production servers
+
+Run with Gunicorn, for example:
+    gunicorn -w $(nproc) --threads 4 --worker-class gthread -b 0.0.0.0:5000 wsgi:application
+"""
+
+from app import app
+
+# WSGI servers look for a callable named ``application`` by default
+application = app